@@ -0,0 +1,36 @@
+"""Tests for ContextBuilder system prompt assembly."""
+
+from pathlib import Path
+
+import pytest
+
+from yeoman.agent.context import ContextBuilder
+
+
+def test_static_prompt_is_reused_until_bootstrap_files_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builder = ContextBuilder(tmp_path)
+    (tmp_path / "USER.md").write_text("prefers tea")
+    builds = 0
+    original = builder._build_static_prompt
+
+    def counting_build(*args: object) -> str:
+        nonlocal builds
+        builds += 1
+        return original(*args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(builder, "_build_static_prompt", counting_build)
+
+    first = builder.build_system_prompt()
+    second = builder.build_system_prompt()
+    assert builds == 1
+    assert "prefers tea" in first
+    assert "# Temporal Grounding" in second.split("---")[-1]
+
+    builder.build_system_prompt(persona_text="pirate")
+    assert builds == 2
+
+    (tmp_path / "USER.md").write_text("prefers coffee now")
+    assert "prefers coffee now" in builder.build_system_prompt()
+    assert builds == 3
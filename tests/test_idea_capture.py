@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from yeoman.pipeline.idea_capture import _capture_kind_and_body
+
+
+def test_accented_prefix_words_match_after_folding() -> None:
+    assert _capture_kind_and_body("Tâche: appeler le plombier") == (
+        "backlog",
+        "appeler le plombier",
+    )
+    assert _capture_kind_and_body("Idée: un vélo cargo") == ("idea", "un vélo cargo")
+    assert _capture_kind_and_body("Télécharger le rapport") is None
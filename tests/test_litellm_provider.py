@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from yeoman.providers import litellm_provider
+from yeoman.providers.base import ToolCallRequest
+from yeoman.providers.litellm_provider import LiteLLMProvider, _with_cache_breakpoints
+
+
+def test_cache_breakpoints_mark_system_and_latest_user_without_mutating() -> None:
+    messages: list[dict[str, Any]] = [
+        {"role": "system", "content": "static prompt"},
+        {"role": "user", "content": "earlier"},
+        {"role": "assistant", "content": "ok"},
+        {"role": "user", "content": [{"type": "text", "text": "look"}, {"type": "image_url"}]},
+        {"role": "tool", "tool_call_id": "t1", "content": "result"},
+    ]
+
+    marked = _with_cache_breakpoints(messages)
+
+    assert marked[0]["content"] == [
+        {"type": "text", "text": "static prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert marked[3]["content"][-1] == {"type": "image_url", "cache_control": {"type": "ephemeral"}}
+    assert marked[1] is messages[1]
+    assert marked[4] is messages[4]
+    assert messages[0]["content"] == "static prompt"
+    assert "cache_control" not in messages[3]["content"][-1]
+
+
+def test_prompt_caching_only_for_supporting_providers() -> None:
+    direct = LiteLLMProvider(default_model="anthropic/claude-sonnet-4-5")
+    assert direct._supports_prompt_caching("anthropic/claude-sonnet-4-5")
+    assert not direct._supports_prompt_caching("gpt-4o")
+
+    via_gateway = LiteLLMProvider(
+        api_base="https://aihubmix.com/v1", default_model="anthropic/claude-sonnet-4-5"
+    )
+    assert not via_gateway._supports_prompt_caching("anthropic/claude-sonnet-4-5")
+
+
+def _tool_delta(
+    index: int, *, call_id: str | None = None, name: str | None = None, args: str = ""
+) -> SimpleNamespace:
+    function = SimpleNamespace(name=name, arguments=args)
+    call = SimpleNamespace(index=index, id=call_id, function=function)
+    delta = SimpleNamespace(content=None, tool_calls=[call])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)], usage=None)
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_hands_out_each_tool_call_once_it_is_complete(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen: list[str] = []
+    usage = SimpleNamespace(prompt_tokens=3, completion_tokens=2, total_tokens=5)
+    chunks = [
+        _tool_delta(0, call_id="a", name="read_file", args='{"path": '),
+        _tool_delta(0, args='"x"}'),
+        _tool_delta(1, call_id="b", name="list_dir"),
+        SimpleNamespace(choices=[], usage=usage),
+    ]
+
+    async def fake_acompletion(**kwargs: Any):
+        assert kwargs["stream"] is True
+
+        async def stream():
+            for chunk in chunks:
+                seen.append("chunk")
+                yield chunk
+
+        return stream()
+
+    def on_tool_call(call: ToolCallRequest) -> None:
+        seen.append(call.id)
+
+    monkeypatch.setattr(litellm_provider, "acompletion", fake_acompletion)
+    provider = LiteLLMProvider(default_model="gpt-4o")
+
+    response = await provider.chat_stream(
+        [{"role": "user", "content": "hi"}], tools=[{}], on_tool_call=on_tool_call
+    )
+
+    assert [(c.id, c.name, c.arguments) for c in response.tool_calls] == [
+        ("a", "read_file", {"path": "x"}),
+        ("b", "list_dir", {}),
+    ]
+    assert seen == ["chunk", "chunk", "chunk", "a", "chunk", "b"]
+    assert response.usage["total_tokens"] == 5
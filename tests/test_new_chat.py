@@ -0,0 +1,80 @@
+"""Tests for NewChatNotifyMiddleware."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from yeoman.core.intents import SendOutboundIntent
+from yeoman.core.models import InboundEvent
+from yeoman.core.pipeline import PipelineContext
+from yeoman.pipeline.new_chat import NewChatNotifyMiddleware
+
+
+def _make_event(**overrides: object) -> InboundEvent:
+    defaults = {
+        "channel": "whatsapp",
+        "chat_id": "120363000000000000@g.us",
+        "sender_id": "491521234567@s.whatsapp.net",
+        "content": "hello",
+        "message_id": "msg-001",
+    }
+    defaults.update(overrides)
+    return InboundEvent(**defaults)
+
+
+async def _next(ctx: PipelineContext) -> None:
+    del ctx
+
+
+class TestNewChatNotifyMiddleware:
+    @pytest.mark.asyncio
+    async def test_notifies_owner_once_and_persists_seen_chat(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+        mw = NewChatNotifyMiddleware(owner_alert_resolver=lambda channel: ["491700000000"])
+
+        first = PipelineContext(event=_make_event())
+        await mw(first, _next)
+        second = PipelineContext(event=_make_event(message_id="msg-002"))
+        await mw(second, _next)
+
+        notices = [i for i in first.intents if isinstance(i, SendOutboundIntent)]
+        assert [n.event.chat_id for n in notices] == ["491700000000@s.whatsapp.net"]
+        assert second.intents == []
+        seen_log = (tmp_path / ".yeoman" / "seen_chats.log").read_text()
+        assert seen_log == "whatsapp:120363000000000000@g.us\n"
+
+    @pytest.mark.asyncio
+    async def test_skips_chat_seen_in_legacy_json_and_migrates_it(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+        seen_path = tmp_path / ".yeoman" / "seen_chats.json"
+        seen_path.parent.mkdir(parents=True)
+        seen_path.write_text(json.dumps({"chats": ["whatsapp:120363000000000000@g.us"]}))
+        mw = NewChatNotifyMiddleware(owner_alert_resolver=lambda channel: ["491700000000"])
+
+        ctx = PipelineContext(event=_make_event())
+        await mw(ctx, _next)
+
+        assert ctx.intents == []
+        seen_log = (tmp_path / ".yeoman" / "seen_chats.log").read_text()
+        assert seen_log == "whatsapp:120363000000000000@g.us\n"
+
+    @pytest.mark.asyncio
+    async def test_compacts_duplicate_log_lines_on_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("HOME", str(tmp_path))
+        seen_log = tmp_path / ".yeoman" / "seen_chats.log"
+        seen_log.parent.mkdir(parents=True)
+        seen_log.write_text("whatsapp:a@g.us\n\nwhatsapp:a@g.us\nwhatsapp:b@g.us\n")
+        mw = NewChatNotifyMiddleware(owner_alert_resolver=lambda channel: ["491700000000"])
+
+        ctx = PipelineContext(event=_make_event(chat_id="b@g.us"))
+        await mw(ctx, _next)
+
+        assert ctx.intents == []
+        assert seen_log.read_text() == "whatsapp:a@g.us\nwhatsapp:b@g.us\n"
@@ -0,0 +1,77 @@
+"""Tests for the gateway's inbound consumer loop."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from yeoman.app.bootstrap import OrchestratorService
+from yeoman.bus.events import InboundMessage
+from yeoman.bus.queue import MessageBus
+from yeoman.core.models import InboundEvent
+
+
+class _RecordingOrchestrator:
+    def __init__(self) -> None:
+        self.events: list[InboundEvent] = []
+
+    async def handle(self, event: InboundEvent) -> list[Any]:
+        self.events.append(event)
+        return []
+
+
+class _FailingOrchestrator:
+    async def handle(self, event: InboundEvent) -> list[Any]:
+        raise RuntimeError(f"boom {event.content}")
+
+
+def _service(bus: MessageBus, orchestrator: Any) -> OrchestratorService:
+    return OrchestratorService(
+        bus=bus,
+        orchestrator=orchestrator,  # type: ignore[arg-type]
+        typing_adapter=None,  # type: ignore[arg-type]
+        telemetry=None,  # type: ignore[arg-type]
+        memory=None,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_handles_inbound_and_stops_without_polling_delay() -> None:
+    bus = MessageBus()
+    orchestrator = _RecordingOrchestrator()
+    service = _service(bus, orchestrator)
+    runner = asyncio.create_task(service.run())
+
+    await bus.publish_inbound(
+        InboundMessage(channel="cli", sender_id="u", chat_id="direct", content="hi")
+    )
+    for _ in range(20):
+        if orchestrator.events:
+            break
+        await asyncio.sleep(0.01)
+    assert [e.content for e in orchestrator.events] == ["hi"]
+
+    service.stop()
+    await asyncio.wait_for(runner, timeout=0.2)
+
+
+@pytest.mark.asyncio
+async def test_error_replies_are_published_off_the_consume_loop() -> None:
+    bus = MessageBus()
+    service = _service(bus, _FailingOrchestrator())
+    for content in ("a", "b"):
+        await bus.publish_inbound(
+            InboundMessage(channel="cli", sender_id="u", chat_id="direct", content=content)
+        )
+    runner = asyncio.create_task(service.run())
+
+    replies = [
+        await asyncio.wait_for(bus.consume_outbound(), timeout=0.5) for _ in range(2)
+    ]
+    service.stop()
+    await asyncio.wait_for(runner, timeout=0.2)
+
+    assert [r.content for r in replies] == [
+        "Sorry, I encountered an error: boom a",
+        "Sorry, I encountered an error: boom b",
+    ]
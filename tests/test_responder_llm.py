@@ -0,0 +1,843 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from yeoman.adapters.responder_llm import LLMResponder, _Prefetch
+from yeoman.agent.tools.base import Tool
+from yeoman.agent.tools.spawn import SpawnTool
+from yeoman.bus.queue import MessageBus
+from yeoman.memory.models import MemoryCaptureResult
+from yeoman.memory.session_state import SessionStateStore
+from yeoman.memory.session_state import SessionStateStore
+from yeoman.providers.base import LLMProvider, LLMResponse, ToolCallRequest
+from yeoman.providers.cache import LLMResponseCache, SemanticResponseCache
+from yeoman.session.manager import SessionManager
+from yeoman.telemetry.inmemory import InMemoryTelemetry
+
+
+class _EchoProvider(LLMProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        del messages, tools, model, max_tokens, temperature
+        self.calls += 1
+        return LLMResponse(content="reply")
+
+    def get_default_model(self) -> str:
+        return "dummy/model"
+
+
+class _ScriptedToolProvider(LLMProvider):
+    """Returns the given tool calls once, then a final text reply."""
+
+    def __init__(self, tool_calls: list[ToolCallRequest]) -> None:
+        super().__init__()
+        self.tool_calls = tool_calls
+        self.calls = 0
+        self.tool_messages: list[dict[str, Any]] = []
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        del tools, model, max_tokens, temperature
+        self.calls += 1
+        if self.calls == 1:
+            return LLMResponse(content=None, tool_calls=list(self.tool_calls))
+        self.tool_messages = [m for m in messages if m.get("role") == "tool"]
+        return LLMResponse(content="done")
+
+    def get_default_model(self) -> str:
+        return "dummy/model"
+
+
+class _RendezvousTool(Tool):
+    """Completes only if its peer call runs concurrently."""
+
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+
+    @property
+    def name(self) -> str:
+        return "rendezvous"
+
+    @property
+    def description(self) -> str:
+        return "test tool"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"role": {"type": "string"}}}
+
+    async def execute(self, role: str = "", **kwargs: Any) -> str:
+        if role == "setter":
+            self.event.set()
+            return "set"
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout=1.0)
+        except TimeoutError:
+            return "timed out"
+        return "met"
+
+
+class _FakeMemory:
+    def __init__(self) -> None:
+        self.recall_queries: list[str] = []
+        self.captured: list[str] = []
+        self.post_writes: list[str] = []
+
+    def pre_write_session_state(self, **kwargs: Any) -> None:
+        del kwargs
+
+    def post_write_session_state(self, *, session_key: str, **kwargs: Any) -> None:
+        del kwargs
+        self.post_writes.append(session_key)
+
+    def build_retrieved_context(self, *, query: str, **kwargs: Any) -> tuple[str, list[object]]:
+        del kwargs
+        self.recall_queries.append(query)
+        return "", []
+
+    def capture_from_turn(self, *, user_message: str, **kwargs: Any) -> MemoryCaptureResult:
+        del kwargs
+        self.captured.append(user_message)
+        return MemoryCaptureResult()
+
+
+def _responder(
+    tmp_path: Path,
+    *,
+    memory: _FakeMemory | None = None,
+    telemetry: InMemoryTelemetry | None = None,
+) -> LLMResponder:
+    workspace = tmp_path / "ws"
+    workspace.mkdir(exist_ok=True)
+    return LLMResponder(
+        bus=MessageBus(),
+        provider=_EchoProvider(),
+        workspace=workspace,
+        memory_service=memory,  # type: ignore[arg-type]
+        telemetry=telemetry,
+    )
+
+
+@pytest.mark.asyncio
+async def test_trivial_acknowledgement_skips_memory_recall(tmp_path: Path) -> None:
+    memory = _FakeMemory()
+    telemetry = InMemoryTelemetry()
+    responder = _responder(tmp_path, memory=memory, telemetry=telemetry)
+
+    await responder.process_direct("ok 👍")
+    await responder.process_direct("what did we decide about the trip?")
+    await responder.aclose()
+
+    assert memory.recall_queries == ["what did we decide about the trip?"]
+    assert telemetry.get_counter("memory_recall_skipped") == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_capture_runs_after_reply_and_drains_on_close(tmp_path: Path) -> None:
+    memory = _FakeMemory()
+    responder = _responder(tmp_path, memory=memory)
+
+    out = await responder.process_direct("remember that I prefer window seats")
+    await responder.aclose()
+
+    assert out == "reply"
+    assert memory.captured == ["remember that I prefer window seats"]
+    assert memory.post_writes == ["cli:direct"]
+    assert not responder._pending_finalizers
+
+
+@pytest.mark.asyncio
+async def test_chat_loop_runs_tool_calls_concurrently_in_call_order(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _ScriptedToolProvider(
+        [
+            ToolCallRequest(id="a", name="rendezvous", arguments={"role": "waiter"}),
+            ToolCallRequest(id="b", name="rendezvous", arguments={"role": "setter"}),
+        ]
+    )
+    responder = LLMResponder(bus=MessageBus(), provider=provider, workspace=workspace)
+    responder.READ_ONLY_TOOLS = frozenset({"rendezvous"})
+    responder.tools.register(_RendezvousTool())
+
+    out = await responder.process_direct("go")
+    await responder.aclose()
+
+    assert out == "done"
+    assert [(m["tool_call_id"], m["content"]) for m in provider.tool_messages] == [
+        ("a", "met"),
+        ("b", "set"),
+    ]
+
+
+def test_tool_definitions_cached_per_allowed_set_and_refreshed_on_register(
+    tmp_path: Path,
+) -> None:
+    responder = _responder(tmp_path)
+    allowed = frozenset({"read_file", "rendezvous"})
+
+    first = responder._tool_definitions(allowed)
+    assert [d["function"]["name"] for d in first] == ["read_file"]
+    assert responder._tool_definitions(frozenset(allowed)) is first
+
+    responder.tools.register(_RendezvousTool())
+    refreshed = responder._tool_definitions(allowed)
+    assert [d["function"]["name"] for d in refreshed] == ["read_file", "rendezvous"]
+
+
+def test_tool_names_reused_until_registry_changes(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    names = responder.tool_names
+    assert responder.tool_names is names
+
+    responder.tools.register(_RendezvousTool())
+    assert responder.tool_names == names | {"rendezvous"}
+
+
+def test_topic_tokens_strip_urls_and_cap_distinct_words() -> None:
+    tokens = LLMResponder._topic_tokens("Check https://example.com/trip TRIP plans, 2024 plans!")
+    assert tokens == {"check", "trip", "plans"}
+
+    many = " ".join(f"word{i:02d}" for i in range(60))
+    assert len(LLMResponder._topic_tokens(many)) == 40
+    assert LLMResponder._topic_tokens("ok go 42") == {"ok", "go"}
+
+
+def test_is_probably_german_scores_distinct_markers() -> None:
+    assert LLMResponder._is_probably_german("Kannst du das bitte machen")
+    assert LLMResponder._is_probably_german("und der die")
+    assert not LLMResponder._is_probably_german("What is the plan for today")
+    assert not LLMResponder._is_probably_german("the cat and the dog und")
+
+
+def test_topic_overlap_on_fingerprints() -> None:
+    left = LLMResponder._topic_fingerprint({"trip", "plans", "berlin"})
+    assert LLMResponder._topic_overlap(left, left) == 1.0
+    assert LLMResponder._topic_overlap(left, 0) == 0.0
+    right = LLMResponder._topic_fingerprint({"trip", "plans", "munich"})
+    assert LLMResponder._topic_overlap(left, right) > 0.0
+
+
+@pytest.mark.asyncio
+async def test_talkative_topic_keeps_a_bounded_window(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    for turn in range(20):
+        await responder._maybe_talkative_cooldown_reply(
+            session_key="g1",
+            sender_id="alice",
+            content=f"berlin trip plans detail{turn}",
+            metadata={"is_group": True},
+            enabled=True,
+            streak_threshold=100,
+            topic_overlap_threshold=0.2,
+            cooldown_seconds=60,
+            delay_seconds=0,
+            use_llm_message=False,
+        )
+
+    state = responder._talkative_state["g1"]
+    assert state.streak == 20
+    assert len(state.topic_fingerprints) == responder.TALKATIVE_TOPIC_WINDOW
+
+
+def test_set_tool_context_follows_re_registered_tools(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    responder._set_tool_context(channel="whatsapp", chat_id="a@g.us", session_key="s1")
+
+    replacement = SpawnTool(manager=responder.subagents)
+    responder.tools.register(replacement)
+    responder._set_tool_context(channel="telegram", chat_id="42", session_key="s2")
+
+    assert replacement._origin_channel == "telegram"
+    assert replacement._origin_chat_id == "42"
+
+
+def test_talkative_state_is_lru_bounded(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    responder.MAX_TALKATIVE_STATES = 2
+
+    first = responder._talkative_state_for("a")
+    responder._talkative_state_for("b")
+    assert responder._talkative_state_for("a") is first
+    responder._talkative_state_for("c")
+
+    assert list(responder._talkative_state) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_talkative_llm_message_is_generated_fresh_each_time(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    provider = responder.provider
+    assert isinstance(provider, _EchoProvider)
+
+    await responder._generate_talkative_message_llm("what is the plan")
+    await responder._generate_talkative_message_llm("how is it going")
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_cache_reuses_final_reply_within_session_scope(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _EchoProvider()
+    telemetry = InMemoryTelemetry()
+    responder = LLMResponder(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=workspace,
+        telemetry=telemetry,
+        llm_cache=LLMResponseCache(ttl_seconds=60, exclude_patterns=[r"\bnow\b"]),
+    )
+    messages = [{"role": "system", "content": "sys"}, {"role": "user", "content": "hi"}]
+
+    async def ask(session_key: str, msgs: list[dict[str, Any]]) -> str:
+        return await responder._chat_loop(
+            messages=list(msgs),
+            allowed_tools=frozenset(),
+            security_context={"session_key": session_key},
+        )
+
+    assert await ask("s1", messages) == "reply"
+    assert await ask("s1", messages) == "reply"
+    assert provider.calls == 1
+    await ask("s2", messages)
+    assert provider.calls == 2
+    await ask("s1", [{"role": "user", "content": "what now"}])
+    await ask("s1", [{"role": "user", "content": "what now"}])
+    assert provider.calls == 4
+    assert telemetry.get_counter("llm_cache_hit") == 1
+
+
+def test_rolling_llm_cache_key_matches_full_key() -> None:
+    cache = LLMResponseCache(ttl_seconds=60)
+    key_for = cache.key_builder(scope="s1", model="m", tool_names={"b", "a"})
+    messages: list[dict[str, Any]] = [{"role": "user", "content": "hi"}]
+    first = key_for(messages)
+    messages.append({"role": "assistant", "content": "x"})
+    second = key_for(messages)
+
+    assert first != second
+    assert second == cache.key_for(
+        scope="s1", model="m", messages=messages, tool_names=["a", "b"]
+    )
+    assert key_for(messages[:1]) == first
+
+
+def test_llm_cache_key_masks_only_the_system_clock_line() -> None:
+    cache = LLMResponseCache(ttl_seconds=60)
+
+    def key(system_clock: str, user_text: str) -> str | None:
+        messages = [
+            {"role": "system", "content": f"prompt\nCurrent local datetime: {system_clock}"},
+            {"role": "user", "content": user_text},
+        ]
+        return cache.key_for(scope="s1", model="m", messages=messages, tool_names=[])
+
+    base = key("2026-10-17T15:00:00+02:00", "book 2026-10-17T15:00:00")
+    assert base == key("2026-10-17T15:04:59+02:00", "book 2026-10-17T15:00:00")
+    assert base != key("2026-10-17T15:00:00+02:00", "book 2026-10-18T09:00:00")
+
+
+class _CountingTool(Tool):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    @property
+    def description(self) -> str:
+        return "test tool"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"q": {"type": "string"}}}
+
+    async def execute(self, q: str = "", **kwargs: Any) -> str:
+        self.calls += 1
+        return f"result:{q}"
+
+
+@pytest.mark.asyncio
+async def test_identical_tool_calls_in_one_response_execute_once(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _ScriptedToolProvider(
+        [
+            ToolCallRequest(id="a", name="counting", arguments={"q": "x"}),
+            ToolCallRequest(id="b", name="counting", arguments={"q": "y"}),
+            ToolCallRequest(id="c", name="counting", arguments={"q": "x"}),
+        ]
+    )
+    telemetry = InMemoryTelemetry()
+    responder = LLMResponder(
+        bus=MessageBus(), provider=provider, workspace=workspace, telemetry=telemetry
+    )
+    responder.READ_ONLY_TOOLS = frozenset({"counting"})
+    tool = _CountingTool()
+    responder.tools.register(tool)
+
+    await responder.process_direct("go")
+
+    assert tool.calls == 2
+    assert [(m["tool_call_id"], m["content"]) for m in provider.tool_messages] == [
+        ("a", "result:x"),
+        ("b", "result:y"),
+        ("c", "result:x"),
+    ]
+    assert telemetry.get_counter("tool_dedup_hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_side_effecting_tool_calls_each_execute(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _ScriptedToolProvider(
+        [
+            ToolCallRequest(id="a", name="counting", arguments={"q": "x"}),
+            ToolCallRequest(id="b", name="counting", arguments={"q": "x"}),
+        ]
+    )
+    telemetry = InMemoryTelemetry()
+    responder = LLMResponder(
+        bus=MessageBus(), provider=provider, workspace=workspace, telemetry=telemetry
+    )
+    tool = _CountingTool()
+    responder.tools.register(tool)
+
+    await responder.process_direct("go")
+
+    assert tool.calls == 2
+    assert telemetry.get_counter("tool_dedup_hit") == 0
+
+
+class _NoteTool(Tool):
+    """Appends to a shared list; the read-only ``notes`` tool reads it back."""
+
+    def __init__(self, notes: list[str]) -> None:
+        self.notes = notes
+
+    @property
+    def name(self) -> str:
+        return "note"
+
+    @property
+    def description(self) -> str:
+        return "test tool"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def execute(self, text: str = "", **kwargs: Any) -> str:
+        await asyncio.sleep(0.01)
+        self.notes.append(text)
+        return "ok"
+
+
+class _NotesTool(_NoteTool):
+    @property
+    def name(self) -> str:
+        return "notes"
+
+    async def execute(self, text: str = "", **kwargs: Any) -> str:
+        return ",".join(self.notes)
+
+
+@pytest.mark.asyncio
+async def test_side_effecting_tool_calls_run_in_call_order(
+    tmp_path: Path,
+) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _ScriptedToolProvider(
+        [
+            ToolCallRequest(id="a", name="notes", arguments={}),
+            ToolCallRequest(id="b", name="note", arguments={"text": "x"}),
+            ToolCallRequest(id="c", name="note", arguments={"text": "y"}),
+            ToolCallRequest(id="d", name="notes", arguments={}),
+        ]
+    )
+    responder = LLMResponder(bus=MessageBus(), provider=provider, workspace=workspace)
+    responder.READ_ONLY_TOOLS = frozenset({"notes"})
+    notes: list[str] = []
+    responder.tools.register(_NoteTool(notes))
+    responder.tools.register(_NotesTool(notes))
+
+    await responder.process_direct("go")
+
+    assert notes == ["x", "y"]
+    assert [(m["tool_call_id"], m["content"]) for m in provider.tool_messages] == [
+        ("a", ""),
+        ("b", "ok"),
+        ("c", "ok"),
+        ("d", "x,y"),
+    ]
+
+
+class _StreamingToolProvider(_ScriptedToolProvider):
+    """Reports each tool call mid-stream and finishes only once the tool has started."""
+
+    def __init__(self, tool_calls: list[ToolCallRequest], started: asyncio.Event) -> None:
+        super().__init__(tool_calls)
+        self.started = started
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        *,
+        on_tool_call: Any,
+    ) -> LLMResponse:
+        if self.calls == 0:
+            for tool_call in self.tool_calls:
+                on_tool_call(tool_call)
+            await asyncio.wait_for(self.started.wait(), timeout=1.0)
+        return await self.chat(messages, tools, model, max_tokens, temperature)
+
+
+@pytest.mark.asyncio
+async def test_streamed_read_only_tool_calls_start_before_response_completes(
+    tmp_path: Path,
+) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    started = asyncio.Event()
+
+    class _SignallingTool(_CountingTool):
+        async def execute(self, q: str = "", **kwargs: Any) -> str:
+            started.set()
+            return await super().execute(q, **kwargs)
+
+    provider = _StreamingToolProvider(
+        [ToolCallRequest(id="a", name="counting", arguments={"q": "x"})], started
+    )
+    telemetry = InMemoryTelemetry()
+    responder = LLMResponder(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=workspace,
+        telemetry=telemetry,
+        stream_tool_calls=True,
+    )
+    responder.READ_ONLY_TOOLS = frozenset({"counting"})
+    tool = _SignallingTool()
+    responder.tools.register(tool)
+
+    assert await responder.process_direct("go") == "done"
+    assert tool.calls == 1
+    assert [m["content"] for m in provider.tool_messages] == ["result:x"]
+    assert telemetry.get_counter("tool_prefetch", labels=(("tool", "counting"),)) == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_stops_at_first_side_effecting_call(tmp_path: Path) -> None:
+    responder = _responder(tmp_path)
+    responder.READ_ONLY_TOOLS = frozenset({"notes"})
+    notes: list[str] = []
+    responder.tools.register(_NoteTool(notes))
+    responder.tools.register(_NotesTool(notes))
+    prefetch = _Prefetch()
+
+    for call_id, name in (("a", "notes"), ("b", "note"), ("c", "notes")):
+        responder._prefetch_tool_call(
+            prefetch,
+            ToolCallRequest(id=call_id, name=name, arguments={}),
+            allowed_tools=frozenset({"note", "notes"}),
+            security_context=None,
+            is_owner=True,
+        )
+
+    assert list(prefetch.tasks) == ["a"]
+    assert await prefetch.tasks["a"] == ""
+
+
+@pytest.mark.asyncio
+async def test_finalizers_for_one_session_run_in_turn_order(tmp_path: Path) -> None:
+    class _SlowFirstPostWrite(_FakeMemory):
+        def __init__(self) -> None:
+            super().__init__()
+            self.started = 0
+
+        def post_write_session_state(self, **kwargs: Any) -> None:
+            turn = self.started
+            self.started += 1
+            if turn == 0:
+                time.sleep(0.05)
+            self.post_writes.append(f"turn-{turn}")
+
+    memory = _SlowFirstPostWrite()
+    responder = _responder(tmp_path, memory=memory)
+    await responder.process_direct("first", session_key="cli:wal")
+    await responder.process_direct("second", session_key="cli:wal")
+    await responder.aclose()
+
+    assert memory.post_writes == ["turn-0", "turn-1"]
+@pytest.mark.asyncio
+async def test_back_to_back_turns_write_wal_entries_in_order(tmp_path: Path) -> None:
+    store = SessionStateStore(tmp_path)
+
+    class _WalMemory(_FakeMemory):
+        def pre_write_session_state(self, **kwargs: Any) -> None:
+            store.pre_write(**kwargs)
+
+        def post_write_session_state(self, **kwargs: Any) -> None:
+            time.sleep(0.05)
+            store.post_write(**kwargs)
+
+    responder = _responder(tmp_path, memory=_WalMemory())
+    await responder.process_direct("first", session_key="cli:wal")
+    await responder.process_direct("second", session_key="cli:wal")
+    await responder.aclose()
+
+    entries = [
+        line.split()[-1] for line in store.read("cli:wal").splitlines() if line.startswith("###")
+    ]
+    assert entries == ["PRE", "POST", "PRE", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_memory_calls_run_on_dedicated_pool(tmp_path: Path) -> None:
+    threads: list[str] = []
+
+    class _ThreadRecordingMemory(_FakeMemory):
+        def build_retrieved_context(self, **kwargs: Any) -> tuple[str, list[object]]:
+            threads.append(threading.current_thread().name)
+            return super().build_retrieved_context(**kwargs)
+
+    responder = _responder(tmp_path, memory=_ThreadRecordingMemory())
+    await responder.process_direct("what did we decide about the trip?")
+    await responder.aclose()
+
+    assert threads and threads[0].startswith("mem")
+    assert responder._memory_executor is None
+
+
+@pytest.mark.asyncio
+async def test_file_reads_are_never_served_from_cache(tmp_path: Path) -> None:
+    telemetry = InMemoryTelemetry()
+    responder = _responder(tmp_path, telemetry=telemetry)
+    responder.cache_web_tool_results = True
+    target = responder.workspace / "notes.txt"
+    target.write_text("v1")
+
+    async def read() -> str:
+        return await responder._run_tool_call(
+            ToolCallRequest(id="x", name="read_file", arguments={"path": str(target)}),
+            allowed_tools=frozenset({"read_file"}),
+            security_context={"session_key": "s1"},
+            is_owner=True,
+            tool_span=None,
+        )
+
+    assert await read() == "v1"
+    target.write_text("changed outside the responder")
+    assert await read() == "changed outside the responder"
+    assert telemetry.get_counter("tool_cache_hit", labels=(("tool", "read_file"),)) == 0
+
+
+@pytest.mark.asyncio
+async def test_web_tool_results_are_cached_only_when_enabled(tmp_path: Path) -> None:
+    class _FakeSearch(_CountingTool):
+        @property
+        def name(self) -> str:
+            return "web_search"
+
+    responder = _responder(tmp_path)
+    tool = _FakeSearch()
+    responder.tools.register(tool)
+
+    async def search(session_key: str = "s1") -> str:
+        return await responder._run_tool_call(
+            ToolCallRequest(id="x", name="web_search", arguments={"q": "news"}),
+            allowed_tools=frozenset({"web_search"}),
+            security_context={"session_key": session_key},
+            is_owner=False,
+            tool_span=None,
+        )
+
+    await search()
+    await search()
+    assert tool.calls == 2
+
+    responder.cache_web_tool_results = True
+    await search()
+    await search()
+    assert tool.calls == 3
+    await search(session_key="s2")
+    assert tool.calls == 4
+
+
+class _LoopingToolProvider(_EchoProvider):
+    """Asks for another tool call whenever tools are offered, at a fixed token usage."""
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        del messages, model, max_tokens, temperature
+        self.calls += 1
+        if tools is None:
+            return LLMResponse(content="answer from what I have")
+        return LLMResponse(
+            content=None,
+            tool_calls=[
+                ToolCallRequest(id=f"c{self.calls}", name="counting", arguments={"q": str(self.calls)})
+            ],
+            usage={"total_tokens": 100},
+        )
+
+
+@pytest.mark.asyncio
+async def test_chat_loop_stops_when_token_budget_is_spent(tmp_path: Path) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    provider = _LoopingToolProvider()
+    telemetry = InMemoryTelemetry()
+    responder = LLMResponder(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=workspace,
+        telemetry=telemetry,
+        max_loop_tokens=250,
+    )
+    responder.tools.register(_CountingTool())
+
+    out = await responder.process_direct("go")
+
+    assert out == "answer from what I have"
+    assert provider.calls == 4
+    assert telemetry.get_counter("chat_loop_budget_exit", labels=(("reason", "tokens"),)) == 1
+
+
+class _KeywordEmbedding:
+    """Embeds text as keyword counts so near-identical questions land close together."""
+
+    def embed(self, text: str) -> list[float]:
+        lowered = text.lower()
+        return [float(lowered.count(word)) for word in ("trip", "weather", "berlin", "budget")]
+
+
+def _semantic_responder(
+    tmp_path: Path, provider: LLMProvider, telemetry: InMemoryTelemetry | None = None
+) -> LLMResponder:
+    memory = _FakeMemory()
+    memory.embedding = _KeywordEmbedding()  # type: ignore[attr-defined]
+    workspace = tmp_path / "ws"
+    workspace.mkdir(exist_ok=True)
+    return LLMResponder(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=workspace,
+        memory_service=memory,  # type: ignore[arg-type]
+        telemetry=telemetry,
+        semantic_cache=SemanticResponseCache(threshold=0.95, ttl_seconds=60),
+    )
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_serves_similar_tool_free_question(tmp_path: Path) -> None:
+    provider = _EchoProvider()
+    telemetry = InMemoryTelemetry()
+    responder = _semantic_responder(tmp_path, provider, telemetry)
+    session = responder.sessions.get_or_create("cli:direct")
+
+    assert await responder.process_direct("Plan a trip to Berlin") == "reply"
+    session.clear()
+    assert await responder.process_direct("trip to berlin??") == "reply"
+    assert provider.calls == 1
+    session.clear()
+    await responder.process_direct("What is the trip budget?")
+    await responder.aclose()
+
+    assert provider.calls == 2
+    assert telemetry.get_counter("semantic_cache_hit") == 1
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_does_not_replay_across_different_history(tmp_path: Path) -> None:
+    provider = _EchoProvider()
+    responder = _semantic_responder(tmp_path, provider)
+
+    await responder.process_direct("Plan a trip to Berlin")
+    await responder.process_direct("trip to berlin??")
+    await responder.aclose()
+
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_is_per_sender_and_skips_contextual_turns(tmp_path: Path) -> None:
+    provider = _EchoProvider()
+    responder = _semantic_responder(tmp_path, provider)
+
+    async def ask(sender_id: str, metadata: dict[str, object] | None = None) -> None:
+        responder.sessions.get_or_create("whatsapp:group@g.us").clear()
+        await responder._generate(
+            session_key="whatsapp:group@g.us",
+            channel="whatsapp",
+            chat_id="group@g.us",
+            content="Plan a trip to Berlin",
+            sender_id=sender_id,
+            media=(),
+            metadata=metadata or {},
+            allowed_tools=frozenset(),
+            persona_text=None,
+        )
+
+    await ask("alice")
+    await ask("bob")
+    assert provider.calls == 2
+    await ask("alice", {"reply_to_text": "the earlier plan"})
+    assert provider.calls == 3
+    await ask("alice")
+    await responder.aclose()
+    assert provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_session_saves_happen_off_the_reply_path_and_drain_on_close(
+    tmp_path: Path,
+) -> None:
+    responder = _responder(tmp_path)
+
+    await asyncio.gather(
+        responder.process_direct("first"),
+        responder.process_direct("second"),
+    )
+    await responder.aclose()
+
+    assert not responder._session_saves
+    reloaded = SessionManager(tmp_path, sessions_dir=responder.workspace / "sessions")
+    contents = [m["content"] for m in reloaded.get_or_create("cli:direct").messages]
+    assert sorted(contents) == ["first", "reply", "reply", "second"]
@@ -1,6 +1,6 @@
 # tests/test_session_tool_traces.py
 import pytest
-from yeoman.session.manager import Session
+from yeoman.session.manager import Session, SessionManager
 
 
 def test_session_stores_tool_call():
@@ -44,3 +44,51 @@ def test_get_history_skips_legacy_rows_without_content():
         {"role": "user", "content": "hi"},
         {"role": "assistant", "content": "hello"},
     ]
+
+
+def test_get_history_tracks_appends_window_and_replacement():
+    session = Session(key="test:chat3")
+    for i in range(6):
+        session.add_message("user", f"m{i}")
+        session.add_tool_call(tool_name="t", tool_call_id=f"tc{i}", arguments={}, result="r")
+
+    assert [m["content"] for m in session.get_history(max_messages=4)] == ["m4", "m5"]
+    session.add_message("assistant", "a6")
+    assert [m["content"] for m in session.get_history(max_messages=4)] == ["m5", "a6"]
+    assert [m["content"] for m in session.get_history(max_messages=8)] == [
+        "m3", "m4", "m5", "a6",
+    ]
+
+    session.clear()
+    session.add_message("user", "fresh")
+    assert session.get_history() == [{"role": "user", "content": "fresh"}]
+
+
+def test_older_snapshot_never_overwrites_newer_save(tmp_path):
+    manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+    session = manager.get_or_create("test:chat4")
+    session.add_message("user", "old")
+    stale = manager._snapshot(session)
+    session.clear()
+    manager.save(session)
+
+    manager._write(*stale)
+
+    assert SessionManager(tmp_path, sessions_dir=tmp_path / "sessions").get_or_create(
+        "test:chat4"
+    ).messages == []
+
+
+def test_session_cache_evicts_least_recently_used(tmp_path):
+    manager = SessionManager(tmp_path, sessions_dir=tmp_path / "sessions")
+    manager.MAX_CACHED_SESSIONS = 2
+    first = manager.get_or_create("test:a")
+    first.add_message("user", "kept on disk")
+    manager.save(first)
+    manager.get_or_create("test:b")
+    manager.get_or_create("test:c")
+
+    reloaded = manager.get_or_create("test:a")
+    assert reloaded is not first
+    assert [m["content"] for m in reloaded.messages] == ["kept on disk"]
+    assert list(manager._cache) == ["test:c", "test:a"]
@@ -0,0 +1,15 @@
+from yeoman.telemetry import InMemoryTelemetry
+
+
+def test_counters_are_tracked_per_label_set() -> None:
+    telemetry = InMemoryTelemetry()
+
+    telemetry.incr("tool_blocked")
+    telemetry.incr("tool_blocked", 2)
+    telemetry.incr("tool_blocked", labels=(("tool", "exec"),))
+
+    assert telemetry.get_counter("tool_blocked") == 3
+    assert telemetry.get_counter("tool_blocked", (("tool", "exec"),)) == 1
+    assert telemetry.get_counter("tool_blocked", (("tool", "web"),)) == 0
+    assert telemetry.get_histogram_values("missing") == []
+    assert "missing" not in {name for name, _ in telemetry.histograms}
@@ -20,6 +20,7 @@ from yeoman.core.admin_commands import (
     AdminCommandResult,
     AdminCommandRouter,
     AdminMetricEvent,
+    is_slash_command,
 )
 from yeoman.core.models import InboundEvent, PolicyDecision
 from yeoman.core.ports import PolicyPort
@@ -145,6 +146,7 @@ class EnginePolicyAdapter(PolicyPort):
     ) -> None:
         self._engine = engine
         self._known_tools = set(known_tools)
+        self._disabled_decision: PolicyDecision | None = None
         self._policy_path = policy_path
         self._session_manager = session_manager
         if workspace is not None:
@@ -447,34 +449,40 @@ class EnginePolicyAdapter(PolicyPort):
         self._last_mtime_ns = self._stat_mtime_ns()
         self._last_reload_check = time.monotonic()
 
+    def _build_disabled_decision(self) -> PolicyDecision:
+        return PolicyDecision(
+            accept_message=True,
+            should_respond=True,
+            allowed_tools=frozenset(self._known_tools),
+            reason="policy_disabled",
+            when_to_reply_mode="all",
+            notes_enabled=False,
+            notes_mode="adaptive",
+            notes_allow_blocked_senders=False,
+            notes_batch_interval_seconds=1800,
+            notes_batch_max_messages=100,
+            voice_output_mode="text",
+            voice_output_tts_route="tts.speak",
+            voice_output_voice="alloy",
+            voice_output_format="opus",
+            voice_output_max_sentences=2,
+            voice_output_max_chars=150,
+            talkative_cooldown_enabled=False,
+            talkative_cooldown_streak_threshold=7,
+            talkative_cooldown_topic_overlap_threshold=0.34,
+            talkative_cooldown_cooldown_seconds=900,
+            talkative_cooldown_delay_seconds=2.5,
+            talkative_cooldown_use_llm_message=False,
+            source="disabled",
+        )
+
     @override
     def evaluate(self, event: InboundEvent) -> PolicyDecision:
         if self._engine is None:
-            return PolicyDecision(
-                accept_message=True,
-                should_respond=True,
-                allowed_tools=frozenset(self._known_tools),
-                reason="policy_disabled",
-                when_to_reply_mode="all",
-                notes_enabled=False,
-                notes_mode="adaptive",
-                notes_allow_blocked_senders=False,
-                notes_batch_interval_seconds=1800,
-                notes_batch_max_messages=100,
-                voice_output_mode="text",
-                voice_output_tts_route="tts.speak",
-                voice_output_voice="alloy",
-                voice_output_format="opus",
-                voice_output_max_sentences=2,
-                voice_output_max_chars=150,
-                talkative_cooldown_enabled=False,
-                talkative_cooldown_streak_threshold=7,
-                talkative_cooldown_topic_overlap_threshold=0.34,
-                talkative_cooldown_cooldown_seconds=900,
-                talkative_cooldown_delay_seconds=2.5,
-                talkative_cooldown_use_llm_message=False,
-                source="disabled",
-            )
+            # Known tools are fixed, so the frozen decision is built once and shared.
+            if self._disabled_decision is None:
+                self._disabled_decision = self._build_disabled_decision()
+            return self._disabled_decision
 
         self._maybe_reload()
         actor = _to_actor(event)
@@ -686,7 +694,7 @@ class EnginePolicyAdapter(PolicyPort):
 
     def route_admin_command(self, event: InboundEvent) -> AdminCommandResult | None:
         """Route one deterministic slash command and return structured outcome."""
-        if event.channel != "whatsapp":
+        if event.channel != "whatsapp" or not is_slash_command(event.content):
             return None
         return self._admin_router.route(_to_admin_context(event))
 
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import hashlib
 import re
 import shlex
 import time
+from collections import OrderedDict
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, override
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, override
 
 from loguru import logger
 
@@ -38,9 +42,11 @@ from yeoman.bus.queue import MessageBus
 from yeoman.core.models import InboundEvent, PolicyDecision
 from yeoman.core.ports import ResponderPort, SecurityPort, TelemetryPort
 from yeoman.media.tts import strip_markdown_for_tts, truncate_for_voice, write_tts_audio_file
-from yeoman.providers.base import LLMProvider
-from yeoman.session.manager import SessionManager
+from yeoman.providers.base import LLMProvider, ToolCallRequest
+from yeoman.providers.cache import LLMResponseCache, RollingCacheKey, SemanticResponseCache
+from yeoman.session.manager import Session, SessionManager
 from yeoman.telemetry import tracing as lf
+from yeoman.utils.helpers import json_dumps
 
 if TYPE_CHECKING:
     from yeoman.caldav.service import CalDAVService
@@ -52,17 +58,145 @@ if TYPE_CHECKING:
     from yeoman.memory.service import MemoryService
 
 
-@dataclass
+# Acknowledgements, laughter and emoji/punctuation-only messages carry nothing worth
+# recalling; matching turns skip embedding + vector search entirely.
+_TRIVIAL_RECALL_RE = re.compile(
+    r"(?:ok(?:ay)?|k+|thx|thanks?|thank you|ty|danke|merci|ja|jo|yes|yep|yup|no|nope|nein|"
+    r"cool|nice|lol|haha+|hehe+|gut|super|top|[\W_]*)[\W_]*",
+    re.IGNORECASE,
+)
+
+
+# Cheap pre-check for the owner approve/deny shortcuts handled by _handle_approve_command.
+_APPROVE_COMMAND_RE = re.compile(r"\s*(?:/approve|/deny|approved?|yes|deny)\b", re.IGNORECASE)
+
+
+# Already-normalized voice_output_mode values skip the strip/lower round-trip.
+_CANONICAL_VOICE_MODES = frozenset({"off", "text", "always", "in_kind"})
+# Placeholder replies from _chat_loop when the model produced no usable text.
+_FALLBACK_REPLIES = frozenset({"⚙️❓", "🤔❓"})
+# Per-message context that shapes the reply but is not part of the semantic cache key.
+_SEMANTIC_CACHE_CONTEXT_KEYS = (
+    "reply_to_text",
+    "reply_context_window",
+    "ambient_context_window",
+    "_contacts_roster_text",
+)
+
+_URL_RE = re.compile(r"https?://\S+")
+_NONWORD_RE = re.compile(r"[^a-z0-9_\s]+")
+
+
+_LANGUAGE_MARKERS = {
+    **dict.fromkeys(
+        (
+            "und", "der", "die", "das", "ist", "nicht", "was",
+            "wie", "heute", "kann", "kannst", "bitte", "danke",
+        ),
+        "de",
+    ),
+    **dict.fromkeys(
+        ("the", "and", "is", "not", "what", "how", "today", "can", "please", "thanks"),
+        "en",
+    ),
+}
+# One pass over the text; lookarounds let adjacent markers share their separating space.
+_LANGUAGE_MARKER_RE = re.compile(
+    r"(?<= )(" + "|".join(map(re.escape, _LANGUAGE_MARKERS)) + r")(?= )"
+)
+
+
+def _first_tokens(words: list[str], *, min_len: int, limit: int) -> set[str]:
+    """Collect up to ``limit`` distinct non-numeric words, stopping as soon as it is full."""
+    tokens: set[str] = set()
+    for word in words:
+        if len(word) >= min_len and not word.isdigit():
+            tokens.add(word)
+            if len(tokens) >= limit:
+                break
+    return tokens
+
+
+def _recall_worth_doing(content: str, ambient: object) -> bool:
+    """Return False for trivially non-informative turns without surrounding context."""
+    if isinstance(ambient, list) and ambient:
+        return True
+    return _TRIVIAL_RECALL_RE.fullmatch(content.strip()) is None
+
+
+def _clean_str(value: object) -> str | None:
+    """Return a stripped string, or None for missing/blank values."""
+    if value is None:
+        return None
+    text = (value if isinstance(value, str) else str(value)).strip()
+    return text or None
+
+
+type _ChannelContextTool = (
+    MessageTool | SendVoiceTool | SpawnTool | CronTool | ContactsTool | OpsManageTool
+)
+
+# Tools whose per-turn context is (channel, chat_id); resolved once per registry version.
+_CHANNEL_CONTEXT_TOOLS: tuple[tuple[str, type[_ChannelContextTool]], ...] = (
+    ("message", MessageTool),
+    ("send_voice", SendVoiceTool),
+    ("spawn", SpawnTool),
+    ("cron", CronTool),
+    ("contacts", ContactsTool),
+    ("ops_manage", OpsManageTool),
+)
+
+
+def _noop_metric(name: str, value: int = 1, labels: tuple[tuple[str, str], ...] = ()) -> None:
+    del name, value, labels
+
+
+@dataclass(slots=True)
 class _TalkativeCooldownState:
     sender_id: str = ""
-    topic_tokens: set[str] = field(default_factory=set)
+    # Fingerprints of the streak's most recent messages, oldest first.
+    topic_fingerprints: tuple[int, ...] = ()
     streak: int = 0
     cooldown_until: float = 0.0
 
 
+@dataclass(slots=True)
+class _Prefetch:
+    """Read-only tool calls started while one response was still streaming."""
+
+    tasks: dict[str, asyncio.Task[str]] = field(default_factory=dict)
+    stopped: bool = False
+
+
 class LLMResponder(ResponderPort):
     """ResponderPort implementation using provider chat-completions + tool loop."""
 
+    # Upper bound for a single memory call; a slow backend degrades recall
+    # instead of stalling the turn.
+    MEMORY_CALL_TIMEOUT_SECONDS = 5.0
+    # Memory calls get their own small pool so a stuck SQLite/embedding call can
+    # not starve the default executor used by asyncio.to_thread elsewhere.
+    MEMORY_EXECUTOR_WORKERS = 2
+    # Backpressure for post-turn memory finalizers: at most this many run at once,
+    # and a finalizer that cannot start within the wait window is dropped.
+    MAX_CONCURRENT_FINALIZERS = 64
+    FINALIZER_WAIT_SECONDS = 30.0
+    # Cap on tool executions in flight when one LLM response fans out into many calls.
+    MAX_CONCURRENT_TOOL_CALLS = 8
+    # Least-recently-active sessions beyond this many lose their cooldown state.
+    MAX_TALKATIVE_STATES = 10_000
+    # A streak's topic is the union of this many of its latest messages.
+    TALKATIVE_TOPIC_WINDOW = 3
+    # Side-effect-free tools; safe to start before the model's response is complete.
+    READ_ONLY_TOOLS = frozenset({"read_file", "list_dir", "web_search", "web_fetch"})
+    # Web tools whose results are reused for identical calls within a session when
+    # cache_web_tool_results is on. Local reads are cheap and never cached.
+    CACHEABLE_TOOL_TTLS: dict[str, float] = {
+        "web_search": 300.0,
+        "web_fetch": 600.0,
+    }
+    MAX_TOOL_RESULT_CACHE = 2048
+
     def __init__(
         self,
         *,
@@ -72,6 +206,10 @@ class LLMResponder(ResponderPort):
         model: str | None = None,
         subagent_model: str | None = None,
         max_iterations: int = 20,
+        max_loop_seconds: float = 0.0,
+        max_loop_tokens: int = 0,
+        stream_tool_calls: bool = False,
+        cache_web_tool_results: bool = False,
         tavily_api_key: str | None = None,
         exec_config: "ExecToolConfig | None" = None,
         cron_service: "CronService | None" = None,
@@ -90,6 +228,8 @@ class LLMResponder(ResponderPort):
         whatsapp_tts_outgoing_dir: Path | None = None,
         whatsapp_tts_max_raw_bytes: int = 160 * 1024,
         recording_notifier: "Callable[[str, str], Awaitable[None]] | None" = None,
+        llm_cache: LLMResponseCache | None = None,
+        semantic_cache: SemanticResponseCache | None = None,
     ) -> None:
         from yeoman.config.schema import ExecToolConfig
 
@@ -98,6 +238,12 @@ class LLMResponder(ResponderPort):
         self.bus = bus
         self.model = model or provider.get_default_model()
         self.max_iterations = max(1, int(max_iterations))
+        # Optional wall-clock and token budgets for one tool loop (0 disables).
+        self.max_loop_seconds = max(0.0, float(max_loop_seconds))
+        self.max_loop_tokens = max(0, int(max_loop_tokens))
+        # Stream tool turns so read-only tools start while the model is still emitting.
+        self.stream_tool_calls = stream_tool_calls
+        self.cache_web_tool_results = cache_web_tool_results
         self.tavily_api_key = tavily_api_key
         self.exec_config = exec_config or ExecToolConfig()
         self.cron_service = cron_service
@@ -105,6 +251,10 @@ class LLMResponder(ResponderPort):
         self.caldav_service = caldav_service
         self.memory = memory_service
         self.telemetry = telemetry
+        # Bound once so call sites skip the telemetry checks when it is disabled.
+        self._metric: Callable[..., None] = (
+            self._safe_metric if telemetry is not None else _noop_metric
+        )
         self.security = security
         self.owner_alert_resolver = owner_alert_resolver
         self.file_access_resolver = file_access_resolver
@@ -114,7 +264,17 @@ class LLMResponder(ResponderPort):
         self._whatsapp_tts_outgoing_dir = whatsapp_tts_outgoing_dir
         self._whatsapp_tts_max_raw_bytes = max(1, int(whatsapp_tts_max_raw_bytes))
         self._recording_notifier = recording_notifier
-        self._talkative_state: dict[str, _TalkativeCooldownState] = {}
+        self._llm_cache = llm_cache
+        self._semantic_cache = semantic_cache
+        self._talkative_state: OrderedDict[str, _TalkativeCooldownState] = OrderedDict()
+        self._pending_finalizers: set[asyncio.Task[None]] = set()
+        # Latest finalizer per session; the next turn's WAL writes queue behind it.
+        self._session_finalizers: dict[str, asyncio.Task[None]] = {}
+        self._finalize_sem = asyncio.Semaphore(self.MAX_CONCURRENT_FINALIZERS)
+        self._tool_call_sem = asyncio.Semaphore(self.MAX_CONCURRENT_TOOL_CALLS)
+        self._memory_executor: ThreadPoolExecutor | None = None
+        self._session_saves: dict[str, asyncio.Task[None]] = {}
+        self._session_save_dirty: set[str] = set()
 
         self.effective_restrict_to_workspace = restrict_to_workspace or (
             self.exec_config.isolation.enabled
@@ -124,6 +284,11 @@ class LLMResponder(ResponderPort):
         self.context = ContextBuilder(workspace)
         self.sessions = session_manager or SessionManager(workspace, sessions_dir=workspace / "sessions")
         self.tools = ToolRegistry()  # type: ignore[no-untyped-call]  # boundary-any
+        self._tool_def_cache: dict[frozenset[str], tuple[int, list[dict[str, Any]]]] = {}
+        self._tool_result_cache: OrderedDict[tuple[object, ...], tuple[float, str]] = OrderedDict()
+        self._channel_context_tools: tuple[_ChannelContextTool, ...] = ()
+        self._exec_tool: ExecTool | None = None
+        self._context_tools_version = -1
         subagent_model_to_use = subagent_model or self.model
         self.subagents = SubagentManager(
             provider=provider,
@@ -136,10 +301,13 @@ class LLMResponder(ResponderPort):
             file_access_resolver=file_access_resolver,
         )
         self._register_default_tools()
+        # Build schemas and context-tool handles now instead of on the first turn.
+        self._tool_definitions(self.tool_names)
+        self._resolve_context_tools()
 
     @property
     def tool_names(self) -> frozenset[str]:
-        return frozenset(self.tools.tool_names)
+        return self.tools.tool_names
 
     def _register_default_tools(self) -> None:
         if self.file_access_resolver is not None:
@@ -227,7 +395,7 @@ class LLMResponder(ResponderPort):
             from yeoman.agent.tools.calendar import CalendarTool
             self.tools.register(CalendarTool(self.caldav_service))
 
-    def _metric(
+    def _safe_metric(
         self,
         name: str,
         value: int = 1,
@@ -241,33 +409,24 @@ class LLMResponder(ResponderPort):
             logger.debug("telemetry incr failed {}={}: {}", name, value, exc)
 
     def _set_tool_context(self, *, channel: str, chat_id: str, session_key: str) -> None:
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(channel, chat_id)
-
-        send_voice_tool = self.tools.get("send_voice")
-        if isinstance(send_voice_tool, SendVoiceTool):
-            send_voice_tool.set_context(channel, chat_id)
-
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(channel, chat_id)
-
+        if self._context_tools_version != self.tools.version:
+            self._resolve_context_tools()
+        for tool in self._channel_context_tools:
+            tool.set_context(channel, chat_id)
+        if self._exec_tool is not None:
+            self._exec_tool.set_session_context(session_key)
+
+    def _resolve_context_tools(self) -> None:
+        """Cache typed handles of context-aware tools until the registry changes."""
+        channel_tools: list[_ChannelContextTool] = []
+        for name, tool_type in _CHANNEL_CONTEXT_TOOLS:
+            tool = self.tools.get(name)
+            if isinstance(tool, tool_type):
+                channel_tools.append(tool)
         exec_tool = self.tools.get("exec")
-        if isinstance(exec_tool, ExecTool):
-            exec_tool.set_session_context(session_key)
-
-        cron_tool = self.tools.get("cron")
-        if isinstance(cron_tool, CronTool):
-            cron_tool.set_context(channel, chat_id)
-
-        contacts_tool = self.tools.get("contacts")
-        if isinstance(contacts_tool, ContactsTool):
-            contacts_tool.set_context(channel, chat_id)
-
-        ops_manage_tool = self.tools.get("ops_manage")
-        if isinstance(ops_manage_tool, OpsManageTool):
-            ops_manage_tool.set_context(channel, chat_id)
+        self._channel_context_tools = tuple(channel_tools)
+        self._exec_tool = exec_tool if isinstance(exec_tool, ExecTool) else None
+        self._context_tools_version = self.tools.version
 
     @staticmethod
     def _parse_owner_raw_voice_command(content: str) -> tuple[str, str] | None:
@@ -329,10 +488,8 @@ class LLMResponder(ResponderPort):
     def _route_for_event(event: InboundEvent) -> tuple[str, str]:
         if event.channel != "system":
             return event.channel, event.chat_id
-        if ":" not in event.chat_id:
-            return "cli", event.chat_id
-        channel, chat_id = event.chat_id.split(":", 1)
-        if not channel or not chat_id:
+        channel, sep, chat_id = event.chat_id.partition(":")
+        if not sep or not channel or not chat_id:
             return "cli", event.chat_id
         return channel, chat_id
 
@@ -421,21 +578,19 @@ class LLMResponder(ResponderPort):
 
     @staticmethod
     def _metadata_for_event(event: InboundEvent) -> dict[str, object]:
-        metadata = dict(event.raw_metadata)
-        metadata.update(
-            {
-                "message_id": event.message_id,
-                "sender_id": event.sender_id,
-                "participant": event.participant,
-                "is_group": event.is_group,
-                "mentioned_bot": event.mentioned_bot,
-                "reply_to_bot": event.reply_to_bot,
-                "reply_to_message_id": event.reply_to_message_id,
-                "reply_to_participant": event.reply_to_participant,
-                "reply_to_text": event.reply_to_text,
-            }
-        )
-        return metadata
+        # Fresh dict in one literal: callers mutate it (e.g. pop the contacts roster).
+        return {
+            **event.raw_metadata,
+            "message_id": event.message_id,
+            "sender_id": event.sender_id,
+            "participant": event.participant,
+            "is_group": event.is_group,
+            "mentioned_bot": event.mentioned_bot,
+            "reply_to_bot": event.reply_to_bot,
+            "reply_to_message_id": event.reply_to_message_id,
+            "reply_to_participant": event.reply_to_participant,
+            "reply_to_text": event.reply_to_text,
+        }
 
     @staticmethod
     def _is_inbound_voice(event: InboundEvent) -> bool:
@@ -453,21 +608,24 @@ class LLMResponder(ResponderPort):
     ) -> bool:
         if outbound_channel != "whatsapp":
             return False
-        mode = str(getattr(decision, "voice_output_mode", "text") or "text").strip().lower()
-        if mode in {"", "off", "text"}:
-            return False
-        if mode == "always":
-            return True
-        if mode == "in_kind":
-            return cls._is_inbound_voice(event)
-        return False
-
-    def _tool_definitions(self, allowed_tools: set[str]) -> list[dict[str, Any]]:
-        return [
-            schema
-            for schema in self.tools.get_definitions()
-            if schema.get("function", {}).get("name") in allowed_tools
-        ]
+        raw_mode = getattr(decision, "voice_output_mode", "text") or "text"
+        mode = raw_mode if raw_mode in _CANONICAL_VOICE_MODES else str(raw_mode).strip().lower()
+        match mode:
+            case "always":
+                return True
+            case "in_kind":
+                return cls._is_inbound_voice(event)
+            case _:
+                return False
+
+    def _tool_definitions(self, allowed_tools: frozenset[str]) -> list[dict[str, Any]]:
+        version = self.tools.version
+        cached = self._tool_def_cache.get(allowed_tools)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        definitions = self.tools.get_definitions_for(allowed_tools)
+        self._tool_def_cache[allowed_tools] = (version, definitions)
+        return definitions
 
     def _model_for_profile(self, profile_name: str | None) -> str | None:
         """Return the model string for a named profile, or None if unresolvable.
@@ -505,11 +663,141 @@ class LLMResponder(ResponderPort):
                 return await self.tools.execute(name, arguments)
         return await self.tools.execute(name, arguments)
 
+    async def _run_tool_call(
+        self,
+        tool_call: ToolCallRequest,
+        *,
+        allowed_tools: frozenset[str],
+        security_context: dict[str, object] | None,
+        is_owner: bool,
+        tool_span: Any,
+    ) -> str:
+        """Apply policy + security checks to one tool call, then execute it."""
+        if tool_call.name not in allowed_tools:
+            result = f"Error: Tool '{tool_call.name}' is blocked by policy for this chat."
+            lf.end_span(tool_span, output=result)
+            return result
+        if self.security is not None:
+            tool_security = self.security.check_tool(
+                tool_call.name,
+                tool_call.arguments,
+                context=security_context,
+            )
+            if tool_security.decision.action == "block":
+                self._metric(
+                    "security_tool_blocked",
+                    labels=(("tool", tool_call.name),),
+                )
+                result = (
+                    "Error: Tool call blocked by security middleware "
+                    f"({tool_security.decision.reason})."
+                )
+                lf.end_span(tool_span, output=result)
+                return result
+            if tool_security.decision.action == "warn":
+                self._metric(
+                    "security_tool_warn",
+                    labels=(("tool", tool_call.name),),
+                )
+        cache_key = self._tool_result_cache_key(tool_call, security_context, is_owner=is_owner)
+        if cache_key is not None:
+            cached = self._tool_result_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._tool_result_cache.move_to_end(cache_key)
+                self._metric("tool_cache_hit", labels=(("tool", tool_call.name),))
+                lf.end_span(tool_span, output=cached[1][:500])
+                return cached[1]
+        async with self._tool_call_sem:
+            result = await self._execute_tool(
+                tool_call.name,
+                tool_call.arguments,
+                is_owner=is_owner,
+            )
+        if cache_key is not None and result and not result.startswith("Error"):
+            ttl = self.CACHEABLE_TOOL_TTLS[tool_call.name]
+            self._tool_result_cache[cache_key] = (time.monotonic() + ttl, result)
+            self._tool_result_cache.move_to_end(cache_key)
+            while len(self._tool_result_cache) > self.MAX_TOOL_RESULT_CACHE:
+                self._tool_result_cache.popitem(last=False)
+        lf.end_span(tool_span, output=result[:500] if result else "")
+        return result
+
+    def _prefetch_tool_call(
+        self,
+        prefetch: _Prefetch,
+        tool_call: ToolCallRequest,
+        *,
+        allowed_tools: frozenset[str],
+        security_context: dict[str, object] | None,
+        is_owner: bool,
+    ) -> None:
+        """Start a streamed read-only tool call before the rest of the response arrives.
+
+        Stops at the first other call: reads after it must see its effects.
+        """
+        if prefetch.stopped:
+            return
+        if tool_call.name not in self.READ_ONLY_TOOLS:
+            prefetch.stopped = True
+            return
+        if not tool_call.id or tool_call.id in prefetch.tasks:
+            return
+        self._metric("tool_prefetch", labels=(("tool", tool_call.name),))
+        prefetch.tasks[tool_call.id] = asyncio.create_task(
+            self._run_tool_call(
+                tool_call,
+                allowed_tools=allowed_tools,
+                security_context=security_context,
+                is_owner=is_owner,
+                tool_span=None,
+            )
+        )
+
+    @staticmethod
+    async def _await_prefetched(task: asyncio.Task[str], tool_span: Any) -> str:
+        result = await task
+        lf.end_span(tool_span, output=result[:500] if result else "")
+        return result
+
+    def _tool_result_cache_key(
+        self,
+        tool_call: ToolCallRequest,
+        security_context: dict[str, object] | None,
+        *,
+        is_owner: bool,
+    ) -> tuple[object, ...] | None:
+        if not self.cache_web_tool_results or tool_call.name not in self.CACHEABLE_TOOL_TTLS:
+            return None
+        # Grants differ per chat and owner, so results never cross sessions.
+        scope = str((security_context or {}).get("session_key") or "")
+        if not scope:
+            return None
+        return (
+            scope,
+            is_owner,
+            tool_call.name,
+            json_dumps(tool_call.arguments, sort_keys=True),
+        )
+
+    def _llm_cache_key(
+        self,
+        *,
+        allowed_tools: frozenset[str],
+        model: str,
+        security_context: dict[str, object] | None,
+    ) -> RollingCacheKey | None:
+        if self._llm_cache is None:
+            return None
+        scope = str((security_context or {}).get("session_key") or "")
+        if not scope:
+            return None
+        return self._llm_cache.key_builder(scope=scope, model=model, tool_names=allowed_tools)
+
     async def _chat_loop(
         self,
         *,
         messages: list[dict[str, Any]],
-        allowed_tools: set[str],
+        allowed_tools: frozenset[str],
         security_context: dict[str, object] | None = None,
         is_owner: bool = False,
         model: str | None = None,
@@ -520,24 +808,66 @@ class LLMResponder(ResponderPort):
         # Guard against the model looping on the same side-effecting tool call
         _sent_calls: set[tuple[str, str]] = set()
         _SEND_TOOLS = frozenset({"message", "send_voice", "send_media"})
-
-        while iteration < self.max_iterations:
+        started = time.monotonic()
+        total_tokens = 0
+        exit_reason: str | None = None
+        # Policy is fixed for the whole message; resolve the schema list once.
+        tool_definitions = self._tool_definitions(allowed_tools)
+        llm_cache = self._llm_cache
+        # Messages only grow inside the loop, so the key hashes each one once.
+        cache_key_for = self._llm_cache_key(
+            allowed_tools=allowed_tools,
+            model=model or self.model,
+            security_context=security_context,
+        )
+        while True:
+            exit_reason = self._chat_loop_budget_exit(iteration, started, total_tokens)
+            if exit_reason is not None:
+                break
             iteration += 1
             iter_span = lf.start_span(
                 trace=trace,
                 name=f"iteration-{iteration}",
             ) if trace is not None else None
+            prefetch = _Prefetch()
             try:
-                response = await self.provider.chat(
-                    messages=messages,
-                    tools=self._tool_definitions(allowed_tools),
-                    model=model or self.model,
+                cache_key = cache_key_for(messages) if cache_key_for is not None else None
+                cached = (
+                    llm_cache.get(cache_key)
+                    if llm_cache is not None and cache_key is not None
+                    else None
                 )
+                if cached is not None:
+                    self._metric("llm_cache_hit")
+                    response = cached
+                elif self.stream_tool_calls and tool_definitions:
+                    response = await self.provider.chat_stream(
+                        messages=messages,
+                        tools=tool_definitions,
+                        model=model or self.model,
+                        on_tool_call=functools.partial(
+                            self._prefetch_tool_call,
+                            prefetch,
+                            allowed_tools=allowed_tools,
+                            security_context=security_context,
+                            is_owner=is_owner,
+                        ),
+                    )
+                else:
+                    response = await self.provider.chat(
+                        messages=messages,
+                        tools=tool_definitions,
+                        model=model or self.model,
+                    )
+                if cached is None and llm_cache is not None and cache_key is not None:
+                    self._metric("llm_cache_miss")
+                    llm_cache.put(cache_key, response)
+                total_tokens += response.usage.get("total_tokens", 0)
                 lf.log_generation(
                     parent=iter_span or trace,
                     name="llm",
                     model=model or self.model,
-                    input={"message_count": len(messages), "has_tools": bool(self._tool_definitions(allowed_tools))},
+                    input={"message_count": len(messages), "has_tools": bool(tool_definitions)},
                     output=response.content,
                     usage={
                         "input": response.usage.get("prompt_tokens", 0),
@@ -547,16 +877,20 @@ class LLMResponder(ResponderPort):
                 )
 
                 if response.has_tool_calls:
+                    # Serialize each call's arguments once; reused for the assistant
+                    # message, the log/span preview and the send-tool dedup key.
+                    tool_calls = response.tool_calls
+                    serialized_args = [json_dumps(tc.arguments) for tc in tool_calls]
                     tool_call_dicts: list[dict[str, Any]] = [
                         {
                             "id": tc.id,
                             "type": "function",
                             "function": {
                                 "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
+                                "arguments": args_json,
                             },
                         }
-                        for tc in response.tool_calls
+                        for tc, args_json in zip(tool_calls, serialized_args, strict=True)
                     ]
                     messages = self.context.add_assistant_message(
                         messages,
@@ -564,76 +898,110 @@ class LLMResponder(ResponderPort):
                         tool_call_dicts,
                     )
 
-                    for tool_call in response.tool_calls:
-                        args_preview = json.dumps(tool_call.arguments, ensure_ascii=False)
-                        logger.info("Tool call: {}({})", tool_call.name, args_preview[:200])
+                    # Pass 1 (in order): log, open spans, apply the send-tool dedup guard
+                    # and collapse repeated identical read-only calls within this response.
+                    tool_spans: list[Any] = []
+                    results: list[str | None] = []
+                    duplicate_idx: set[int] = set()
+                    first_call_idx: dict[tuple[str, str], int] = {}
+                    repeat_of: dict[int, int] = {}
+                    for tool_call, args_preview in zip(tool_calls, serialized_args, strict=True):
+                        logger.info("Tool call: {}({:.200})", tool_call.name, args_preview)
                         tool_span = lf.start_span(
                             trace=trace,
                             name=f"tool/{tool_call.name}",
                             metadata={"arguments": args_preview[:500]},
                             parent_span_id=iter_span.span_id if iter_span else None,
                         ) if trace is not None else None
+                        tool_spans.append(tool_span)
+                        results.append(None)
 
                         # --- dedup guard for send-type tools ---
                         if tool_call.name in _SEND_TOOLS:
                             call_key = (tool_call.name, args_preview)
                             if call_key in _sent_calls:
-                                result = (
+                                results[-1] = (
                                     f"Blocked: you already called {tool_call.name} "
                                     "with these exact arguments earlier in this turn. "
                                     "The message was already delivered. "
                                     "Tell the user it was already sent."
                                 )
                                 logger.warning("Blocked duplicate tool call: {}", tool_call.name)
-                                lf.end_span(tool_span, output=result)
-                                messages = self.context.add_tool_result(
-                                    messages, tool_call.id, tool_call.name, result,
-                                )
+                                lf.end_span(tool_span, output=results[-1])
+                                duplicate_idx.add(len(results) - 1)
                                 continue
                             _sent_calls.add(call_key)
-
-                        if tool_call.name not in allowed_tools:
-                            result = (
-                                f"Error: Tool '{tool_call.name}' is blocked by policy for this chat."
-                            )
-                            lf.end_span(tool_span, output=result)
+                        elif tool_call.name in self.READ_ONLY_TOOLS:
+                            call_key = (tool_call.name, args_preview)
+                            if call_key in first_call_idx:
+                                repeat_of[len(results) - 1] = first_call_idx[call_key]
+                            else:
+                                first_call_idx[call_key] = len(results) - 1
                         else:
-                            if self.security is not None:
-                                tool_security = self.security.check_tool(
-                                    tool_call.name,
-                                    tool_call.arguments,
-                                    context=security_context,
+                            # Side effects are never collapsed, and a read after them
+                            # must not reuse a result from before.
+                            first_call_idx.clear()
+
+                    # Pass 2 (in call order): runs of consecutive read-only calls are
+                    # gathered; every other call runs alone, after the calls before it, so
+                    # a read never races a write, exec or send from the same response.
+                    async def run_reads(batch: list[int]) -> None:
+                        gathered = await asyncio.gather(
+                            *(
+                                self._await_prefetched(
+                                    prefetch.tasks.pop(tool_calls[idx].id), tool_spans[idx]
                                 )
-                                if tool_security.decision.action == "block":
-                                    self._metric(
-                                        "security_tool_blocked",
-                                        labels=(("tool", tool_call.name),),
-                                    )
-                                    result = (
-                                        "Error: Tool call blocked by security middleware "
-                                        f"({tool_security.decision.reason})."
-                                    )
-                                    lf.end_span(tool_span, output=result)
-                                else:
-                                    if tool_security.decision.action == "warn":
-                                        self._metric(
-                                            "security_tool_warn",
-                                            labels=(("tool", tool_call.name),),
-                                        )
-                                    result = await self._execute_tool(
-                                        tool_call.name,
-                                        tool_call.arguments,
-                                        is_owner=is_owner,
-                                    )
-                                    lf.end_span(tool_span, output=result[:500] if result else "")
-                            else:
-                                result = await self._execute_tool(
-                                    tool_call.name,
-                                    tool_call.arguments,
+                                if tool_calls[idx].id in prefetch.tasks
+                                else self._run_tool_call(
+                                    tool_calls[idx],
+                                    allowed_tools=allowed_tools,
+                                    security_context=security_context,
                                     is_owner=is_owner,
+                                    tool_span=tool_spans[idx],
                                 )
-                                lf.end_span(tool_span, output=result[:500] if result else "")
-                        if hasattr(self, '_current_session') and self._current_session is not None:
+                                for idx in batch
+                            ),
+                            return_exceptions=True,
+                        )
+                        for idx, outcome in zip(batch, gathered, strict=True):
+                            if isinstance(outcome, BaseException):
+                                outcome = f"Error executing {tool_calls[idx].name}: {outcome}"
+                                lf.end_span(tool_spans[idx], output=outcome)
+                            results[idx] = outcome
+
+                    batch: list[int] = []
+                    for idx, tool_call in enumerate(tool_calls):
+                        if results[idx] is not None or idx in repeat_of:
+                            continue
+                        if tool_call.name in self.READ_ONLY_TOOLS:
+                            batch.append(idx)
+                            continue
+                        if batch:
+                            await run_reads(batch)
+                            batch = []
+                        results[idx] = await self._run_tool_call(
+                            tool_call,
+                            allowed_tools=allowed_tools,
+                            security_context=security_context,
+                            is_owner=is_owner,
+                            tool_span=tool_spans[idx],
+                        )
+                    if batch:
+                        await run_reads(batch)
+                    for idx, first_idx in repeat_of.items():
+                        results[idx] = results[first_idx]
+                        lf.end_span(tool_spans[idx], output="(shared result of identical call)")
+                    if repeat_of:
+                        self._metric("tool_dedup_hit", len(repeat_of))
+
+                    # Pass 3 (in order): record traces and feed results back to the model.
+                    for idx, tool_call in enumerate(tool_calls):
+                        result = results[idx] or ""
+                        if (
+                            idx not in duplicate_idx
+                            and hasattr(self, '_current_session')
+                            and self._current_session is not None
+                        ):
                             self._current_session.add_tool_call(
                                 tool_name=tool_call.name,
                                 tool_call_id=tool_call.id,
@@ -651,12 +1019,45 @@ class LLMResponder(ResponderPort):
                 final_content = response.content
                 break
             finally:
+                # Early-started reads the model's final call list did not keep.
+                for task in prefetch.tasks.values():
+                    task.cancel()
                 lf.end_span(iter_span)
-        else:
-            return "⚙️❓"  # max iterations reached without a text response
+
+        if exit_reason is not None:
+            logger.warning(
+                "chat loop stopped after {} iterations ({}s, {} tokens): {} budget",
+                iteration,
+                round(time.monotonic() - started, 1),
+                total_tokens,
+                exit_reason,
+            )
+            self._metric("chat_loop_budget_exit", labels=(("reason", exit_reason),))
+            if exit_reason != "iter":
+                # Let the model answer from the tool results it already has.
+                response = await self.provider.chat(
+                    messages=messages,
+                    tools=None,
+                    model=model or self.model,
+                )
+                if response.finish_reason != "error" and response.content:
+                    return response.content
+            return "⚙️❓"  # budget exhausted without a text response
 
         return final_content or "🤔❓"
 
+    def _chat_loop_budget_exit(
+        self, iteration: int, started: float, total_tokens: int
+    ) -> str | None:
+        """Return which budget stops the tool loop before another LLM call, if any."""
+        if iteration >= self.max_iterations:
+            return "iter"
+        if self.max_loop_seconds and time.monotonic() - started > self.max_loop_seconds:
+            return "wall"
+        if self.max_loop_tokens and total_tokens > self.max_loop_tokens:
+            return "tokens"
+        return None
+
     async def _handle_approve_command(self, channel: str, sender_id: str, content: str) -> str | None:
         """Handle owner approve/deny commands for new groups.
 
@@ -727,56 +1128,30 @@ class LLMResponder(ResponderPort):
 
     @staticmethod
     def _topic_tokens(text: str) -> set[str]:
-        compact = re.sub(r"https?://\S+", " ", text.lower())
-        compact = re.sub(r"[^a-z0-9_\s]+", " ", compact)
-        tokens = {t for t in compact.split() if len(t) >= 4 and not t.isdigit()}
-        if tokens:
-            return set(list(tokens)[:40])
-        fallback = {t for t in compact.split() if len(t) >= 2 and not t.isdigit()}
-        return set(list(fallback)[:24])
+        words = _NONWORD_RE.sub(" ", _URL_RE.sub(" ", text.lower())).split()
+        return _first_tokens(words, min_len=4, limit=40) or _first_tokens(
+            words, min_len=2, limit=24
+        )
+
+    @staticmethod
+    def _topic_fingerprint(tokens: set[str]) -> int:
+        """Fold tokens into a 256-bit bitmap so overlap is two popcounts."""
+        fingerprint = 0
+        for token in tokens:
+            fingerprint |= 1 << (hash(token) & 0xFF)
+        return fingerprint
 
     @staticmethod
-    def _topic_overlap(left: set[str], right: set[str]) -> float:
+    def _topic_overlap(left: int, right: int) -> float:
         if not left or not right:
             return 0.0
-        union = left | right
-        if not union:
-            return 0.0
-        return len(left & right) / len(union)
+        return (left & right).bit_count() / (left | right).bit_count()
 
     @staticmethod
     def _is_probably_german(text: str) -> bool:
-        lowered = f" {text.lower()} "
-        de_markers = (
-            " und ",
-            " der ",
-            " die ",
-            " das ",
-            " ist ",
-            " nicht ",
-            " was ",
-            " wie ",
-            " heute ",
-            " kann ",
-            " kannst ",
-            " bitte ",
-            " danke ",
-        )
-        en_markers = (
-            " the ",
-            " and ",
-            " is ",
-            " not ",
-            " what ",
-            " how ",
-            " today ",
-            " can ",
-            " please ",
-            " thanks ",
-        )
-        de_score = sum(1 for marker in de_markers if marker in lowered)
-        en_score = sum(1 for marker in en_markers if marker in lowered)
-        return de_score >= en_score
+        found = set(_LANGUAGE_MARKER_RE.findall(f" {text.lower()} "))
+        de_score = sum(1 for marker in found if _LANGUAGE_MARKERS[marker] == "de")
+        return de_score >= len(found) - de_score
 
     def _talkative_message_for(self, text: str) -> str:
         if self._is_probably_german(text):
@@ -812,16 +1187,14 @@ class LLMResponder(ResponderPort):
             },
         ]
         try:
-            response = await asyncio.wait_for(
-                self.provider.chat(
+            async with asyncio.timeout(6.0):
+                response = await self.provider.chat(
                     messages=prompt,
                     tools=[],
                     model=self.model,
                     max_tokens=80,
                     temperature=0.9,
-                ),
-                timeout=6.0,
-            )
+                )
         except Exception as exc:
             logger.debug("talkative llm message generation failed: {}", exc)
             return None
@@ -835,6 +1208,18 @@ class LLMResponder(ResponderPort):
             content = content[:220].rstrip() + "..."
         return content
 
+    def _talkative_state_for(self, session_key: str) -> _TalkativeCooldownState:
+        """Return the (LRU-tracked) cooldown state for a session, creating it if needed."""
+        state = self._talkative_state.get(session_key)
+        if state is None:
+            state = _TalkativeCooldownState()
+            self._talkative_state[session_key] = state
+            if len(self._talkative_state) > self.MAX_TALKATIVE_STATES:
+                self._talkative_state.popitem(last=False)
+        else:
+            self._talkative_state.move_to_end(session_key)
+        return state
+
     async def _maybe_talkative_cooldown_reply(
         self,
         *,
@@ -860,35 +1245,37 @@ class LLMResponder(ResponderPort):
         tokens = self._topic_tokens(content)
         if not tokens:
             return None
+        fingerprint = self._topic_fingerprint(tokens)
 
-        state = self._talkative_state.get(session_key, _TalkativeCooldownState())
+        state = self._talkative_state_for(session_key)
         same_sender = actor == state.sender_id
+        topic = 0
+        for recent in state.topic_fingerprints:
+            topic |= recent
         same_topic = (
             same_sender
-            and bool(state.topic_tokens)
-            and self._topic_overlap(tokens, state.topic_tokens) >= float(topic_overlap_threshold)
+            and self._topic_overlap(fingerprint, topic) >= float(topic_overlap_threshold)
         )
 
         if same_sender and same_topic:
             state.streak += 1
-            state.topic_tokens = set(list(state.topic_tokens | tokens)[:40])
+            state.topic_fingerprints = (*state.topic_fingerprints, fingerprint)[
+                -self.TALKATIVE_TOPIC_WINDOW :
+            ]
         else:
             state.sender_id = actor
-            state.topic_tokens = tokens
+            state.topic_fingerprints = (fingerprint,)
             state.streak = 1
 
         now = time.monotonic()
         if state.cooldown_until > now:
-            self._talkative_state[session_key] = state
             return None
 
         if state.streak < int(streak_threshold):
-            self._talkative_state[session_key] = state
             return None
 
         state.cooldown_until = now + float(cooldown_seconds)
         state.streak = 0
-        self._talkative_state[session_key] = state
 
         if delay_seconds > 0:
             await asyncio.sleep(float(delay_seconds))
@@ -898,6 +1285,229 @@ class LLMResponder(ResponderPort):
                 return llm_message
         return self._talkative_message_for(content)
 
+    async def _call_memory[T](
+        self,
+        name: str,
+        fn: Callable[..., T],
+        /,
+        **kwargs: Any,
+    ) -> T | None:
+        """Run a blocking memory call on the memory pool, bounded by a timeout.
+
+        Memory is best-effort: failures and timeouts are logged, counted as
+        ``memory_<name>_error`` and reported to the caller as ``None``.
+        """
+        try:
+            async with asyncio.timeout(self.MEMORY_CALL_TIMEOUT_SECONDS):
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_memory_executor(), functools.partial(fn, **kwargs)
+                )
+        except Exception as e:
+            logger.warning("memory {} failed: {}", name, e or e.__class__.__name__)
+            self._metric(f"memory_{name}_error")
+            return None
+
+    def _get_memory_executor(self) -> ThreadPoolExecutor:
+        if self._memory_executor is None:
+            self._memory_executor = ThreadPoolExecutor(
+                max_workers=self.MEMORY_EXECUTOR_WORKERS, thread_name_prefix="mem"
+            )
+        return self._memory_executor
+
+    def _shutdown_memory_executor(self) -> None:
+        if self._memory_executor is not None:
+            self._memory_executor.shutdown(wait=False, cancel_futures=True)
+            self._memory_executor = None
+
+    async def _semantic_query_vector(
+        self, content: str, media: tuple[str, ...], metadata: dict[str, object]
+    ) -> list[float] | None:
+        """Embed ``content`` for the semantic reply cache, or None when it does not apply."""
+        cache = self._semantic_cache
+        embedding = getattr(self.memory, "embedding", None)
+        if cache is None or embedding is None or media or not cache.accepts(content):
+            return None
+        # Replies shaped by the quoted/ambient conversation or the roster are not
+        # answers to the bare text, so they are neither looked up nor stored.
+        if any(metadata.get(key) for key in _SEMANTIC_CACHE_CONTEXT_KEYS):
+            return None
+        return await self._call_memory("semantic_embed", embedding.embed, text=content)
+
+    async def _recall_memory(
+        self,
+        *,
+        channel: str,
+        chat_id: str,
+        sender_id: str | None,
+        content: str,
+        metadata: dict[str, object],
+    ) -> str:
+        """Return rendered memory context for the turn ("" when nothing applies)."""
+        if self.memory is None:
+            return ""
+        ambient_raw = metadata.get("ambient_context_window")
+        if not metadata.get("reply_to_text") and not _recall_worth_doing(content, ambient_raw):
+            self._metric("memory_recall_skipped")
+            return ""
+
+        # Augment the memory query with recent ambient messages so that vague
+        # inputs like "what do you think?" can surface relevant memories.
+        memory_query = content
+        if isinstance(ambient_raw, list) and ambient_raw:
+            ambient_snippet = " ".join(
+                (line.split("] ", 1)[-1] if "] " in line else line)
+                for line in ambient_raw[:5]
+                if isinstance(line, str)
+            ).strip()
+            if ambient_snippet:
+                memory_query = f"{ambient_snippet} {content}".strip()
+        recalled = await self._call_memory(
+            "recall",
+            self.memory.build_retrieved_context,
+            channel=channel,
+            chat_id=chat_id,
+            sender_id=sender_id,
+            query=memory_query,
+            reply_to_text=_clean_str(metadata.get("reply_to_text")),
+        )
+        retrieved_memory_text = ""
+        retrieved_hits_count = 0
+        if recalled is not None:
+            retrieved_memory_text, retrieved_hits = recalled
+            retrieved_hits_count = len(retrieved_hits)
+
+        if retrieved_hits_count > 0:
+            self._metric("memory_recall_hit")
+        else:
+            self._metric("memory_recall_miss")
+        if retrieved_memory_text:
+            self._metric("memory_prompt_chars", len(retrieved_memory_text))
+        return retrieved_memory_text
+
+    def _save_session_soon(self, session: Session) -> None:
+        """Persist ``session`` off the reply path; saves that pile up per chat coalesce."""
+        key = session.key
+        if key in self._session_saves:
+            self._session_save_dirty.add(key)
+            return
+        self._session_saves[key] = asyncio.create_task(self._save_session(session))
+
+    async def _save_session(self, session: Session) -> None:
+        key = session.key
+        try:
+            while True:
+                self._session_save_dirty.discard(key)
+                try:
+                    await self.sessions.save_async(session)
+                except Exception as e:
+                    logger.warning("session save failed for {}: {}", key, e)
+                if key not in self._session_save_dirty:
+                    return
+        finally:
+            self._session_saves.pop(key, None)
+
+    def _schedule_finalizer(self, session_key: str, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(
+            self._after_task(self._session_finalizers.get(session_key), self._run_finalizer(coro))
+        )
+        self._session_finalizers[session_key] = task
+        self._pending_finalizers.add(task)
+        task.add_done_callback(self._pending_finalizers.discard)
+        task.add_done_callback(functools.partial(self._forget_session_finalizer, session_key))
+
+    def _forget_session_finalizer(self, session_key: str, task: asyncio.Task[None]) -> None:
+        if self._session_finalizers.get(session_key) is task:
+            del self._session_finalizers[session_key]
+
+    @staticmethod
+    async def _after_task[T](
+        previous: asyncio.Task[None] | None, coro: Coroutine[Any, Any, T]
+    ) -> T:
+        """Await ``coro`` once ``previous`` (a session's last finalizer) has finished.
+
+        Keeps WAL pre/post writes of back-to-back turns in turn order.
+        """
+        if previous is not None:
+            try:
+                await asyncio.wait({previous})
+            except BaseException:
+                coro.close()
+                raise
+        return await coro
+
+    async def _run_finalizer(self, coro: Coroutine[Any, Any, None]) -> None:
+        try:
+            async with asyncio.timeout(self.FINALIZER_WAIT_SECONDS):
+                await self._finalize_sem.acquire()
+        except TimeoutError:
+            coro.close()
+            logger.warning(
+                "memory finalize backlog saturated ({} pending); dropping post-turn capture",
+                len(self._pending_finalizers),
+            )
+            self._metric("memory_finalize_dropped")
+            return
+        try:
+            await coro
+        finally:
+            self._finalize_sem.release()
+
+    async def _finalize_turn(
+        self,
+        *,
+        session_key: str,
+        channel: str,
+        chat_id: str,
+        sender_id: str | None,
+        content: str,
+        source_message_id: str | None,
+        final_content: str,
+    ) -> None:
+        """Run post-turn memory capture and WAL post-write off the reply path."""
+        if self.memory is None:
+            return
+        # Capture only enqueues extraction and post-write is an independent WAL update,
+        # so both thread hops run concurrently; each keeps its own error isolation.
+        capture_result, _ = await asyncio.gather(
+            self._call_memory(
+                "capture",
+                self.memory.capture_from_turn,
+                channel=channel,
+                chat_id=chat_id,
+                sender_id=sender_id,
+                user_message=content,
+                source_message_id=source_message_id,
+                assistant_reply=final_content,
+            ),
+            self._call_memory(
+                "post_write",
+                self.memory.post_write_session_state,
+                session_key=session_key,
+                assistant_reply=final_content,
+                pending_actions=[],
+            ),
+        )
+        if capture_result is None:
+            return
+        logger.info(
+            "memory capture: saved={} deduped={} dropped_low_conf={} dropped_safety={}",
+            len(capture_result.saved),
+            capture_result.deduped,
+            capture_result.dropped_low_confidence,
+            capture_result.dropped_safety,
+        )
+        if capture_result.saved:
+            self._metric("memory_capture_saved", len(capture_result.saved))
+        if capture_result.dropped_low_confidence:
+            self._metric(
+                "memory_capture_dropped_low_conf",
+                capture_result.dropped_low_confidence,
+            )
+        if capture_result.dropped_safety:
+            self._metric("memory_capture_dropped_safety", capture_result.dropped_safety)
+        if capture_result.deduped:
+            self._metric("memory_capture_deduped", capture_result.deduped)
+
     async def _generate(
         self,
         *,
@@ -908,7 +1518,7 @@ class LLMResponder(ResponderPort):
         sender_id: str | None,
         media: tuple[str, ...],
         metadata: dict[str, object],
-        allowed_tools: set[str],
+        allowed_tools: frozenset[str],
         persona_text: str | None,
         talkative_cooldown_enabled: bool = False,
         talkative_cooldown_streak_threshold: int = 7,
@@ -920,7 +1530,7 @@ class LLMResponder(ResponderPort):
         model_profile: str | None = None,
     ) -> str:
         # Handle owner approve/deny commands
-        if is_owner and channel == "whatsapp":
+        if is_owner and channel == "whatsapp" and _APPROVE_COMMAND_RE.match(content):
             approval_response = await self._handle_approve_command(channel, sender_id or "", content)
             if approval_response:
                 return approval_response
@@ -943,7 +1553,7 @@ class LLMResponder(ResponderPort):
         # Save session immediately on first message (even if no response yet)
         if not session.messages:
             session.add_message("user", content)
-            self.sessions.save(session)
+            self._save_session_soon(session)
             # Track that we've already added the user message to avoid duplication
             _user_message_already_added = True
         else:
@@ -951,17 +1561,25 @@ class LLMResponder(ResponderPort):
 
         self._set_tool_context(channel=channel, chat_id=chat_id, session_key=session_key)
 
+        # The WAL pre-write overlaps recall and generation. It queues behind the previous
+        # turn's finalizer and is awaited before this turn's finalizer is scheduled, so
+        # pre/post writes stay ordered across turns.
+        pre_write: asyncio.Task[None] | None = None
         if self.memory is not None:
-            try:
-                self.memory.pre_write_session_state(
-                    session_key=session_key,
-                    channel=channel,
-                    chat_id=chat_id,
-                    user_message=content,
-                    metadata=metadata,
+            pre_write = asyncio.create_task(
+                self._after_task(
+                    self._session_finalizers.get(session_key),
+                    self._call_memory(
+                        "pre_write",
+                        self.memory.pre_write_session_state,
+                        session_key=session_key,
+                        channel=channel,
+                        chat_id=chat_id,
+                        user_message=content,
+                        metadata=dict(metadata),
+                    ),
                 )
-            except Exception as e:
-                logger.warning("memory wal pre-write failed: {}", e)
+            )
 
         owner_raw_voice_reply = await self._maybe_handle_owner_raw_voice_command(
             channel=channel,
@@ -971,41 +1589,7 @@ class LLMResponder(ResponderPort):
         if owner_raw_voice_reply is not None:
             final_content = owner_raw_voice_reply
         else:
-            retrieved_memory_text = ""
-            retrieved_hits_count = 0
-            if self.memory is not None:
-                try:
-                    # Augment the memory query with recent ambient messages so that vague
-                    # inputs like "what do you think?" can surface relevant memories.
-                    memory_query = content
-                    ambient_raw = metadata.get("ambient_context_window") if metadata else None
-                    if isinstance(ambient_raw, list) and ambient_raw:
-                        ambient_snippet = " ".join(
-                            (line.split("] ", 1)[-1] if "] " in line else line)
-                            for line in ambient_raw[:5]
-                            if isinstance(line, str)
-                        ).strip()
-                        if ambient_snippet:
-                            memory_query = f"{ambient_snippet} {content}".strip()
-                    retrieved_memory_text, retrieved_hits = self.memory.build_retrieved_context(
-                        channel=channel,
-                        chat_id=chat_id,
-                        sender_id=sender_id,
-                        query=memory_query,
-                        reply_to_text=str(metadata.get("reply_to_text") or "").strip() or None,
-                    )
-                    retrieved_hits_count = len(retrieved_hits)
-                except Exception as e:
-                    logger.warning("memory recall failed: {}", e)
-
-                if retrieved_hits_count > 0:
-                    self._metric("memory_recall_hit")
-                else:
-                    self._metric("memory_recall_miss")
-                if retrieved_memory_text:
-                    self._metric("memory_prompt_chars", len(retrieved_memory_text))
-
-            talkative_reply = await self._maybe_talkative_cooldown_reply(
+            talkative_check = self._maybe_talkative_cooldown_reply(
                 session_key=session_key,
                 sender_id=sender_id,
                 content=content,
@@ -1017,8 +1601,44 @@ class LLMResponder(ResponderPort):
                 delay_seconds=talkative_cooldown_delay_seconds,
                 use_llm_message=talkative_cooldown_use_llm_message,
             )
+            query_vector: list[float] | None = None
+            if self.memory is not None:
+                # Recall, the cooldown check and the semantic-cache embedding are
+                # independent; overlap them.
+                retrieved_memory_text, talkative_reply, query_vector = await asyncio.gather(
+                    self._recall_memory(
+                        channel=channel,
+                        chat_id=chat_id,
+                        sender_id=sender_id,
+                        content=content,
+                        metadata=metadata,
+                    ),
+                    talkative_check,
+                    self._semantic_query_vector(content, media, metadata),
+                )
+            else:
+                retrieved_memory_text, talkative_reply = "", await talkative_check
+            history = session.get_history(max_messages=20 if chat_id.endswith("@g.us") else 50)
+            semantic_cache = self._semantic_cache
+            # Group chats share one session; answers about "me" must stay per sender.
+            semantic_scope = f"{session_key}\x00{sender_id or ''}\x00{persona_text or ''}"
+            if semantic_cache is not None and query_vector is not None:
+                # The same words mean something else after different turns, so the
+                # conversation so far is part of the scope.
+                preceding = history[:-1] if _user_message_already_added else history
+                semantic_scope += "\x00" + hashlib.blake2b(
+                    json_dumps(preceding).encode(), digest_size=16
+                ).hexdigest()
+            cached_reply = (
+                semantic_cache.get(semantic_scope, query_vector)
+                if semantic_cache is not None and query_vector is not None
+                else None
+            )
             if talkative_reply is not None:
                 final_content = talkative_reply
+            elif cached_reply is not None:
+                self._metric("semantic_cache_hit")
+                final_content = cached_reply
             else:
                 # Append contacts roster if present
                 roster_text = metadata.pop("_contacts_roster_text", None)
@@ -1029,9 +1649,7 @@ class LLMResponder(ResponderPort):
                         retrieved_memory_text = str(roster_text)
 
                 messages = self.context.build_messages(
-                    history=session.get_history(
-                        max_messages=20 if chat_id.endswith("@g.us") else 50
-                    ),
+                    history=history,
                     current_message=content,
                     current_metadata=metadata,
                     retrieved_memory_text=retrieved_memory_text,
@@ -1042,6 +1660,7 @@ class LLMResponder(ResponderPort):
                 )
 
                 self._current_session = session
+                rows_before_loop = len(session.messages)
                 final_content = await self._chat_loop(
                     messages=messages,
                     allowed_tools=allowed_tools,
@@ -1056,52 +1675,37 @@ class LLMResponder(ResponderPort):
                     trace=trace,
                 )
                 self._current_session = None
-
+                if (
+                    semantic_cache is not None
+                    and query_vector is not None
+                    # Tool traces mean the reply depended on side effects; never replay it.
+                    and len(session.messages) == rows_before_loop
+                    and final_content not in _FALLBACK_REPLIES
+                ):
+                    semantic_cache.put(semantic_scope, query_vector, final_content)
+
+        if pre_write is not None:
+            await pre_write
         if self.memory is not None:
-            try:
-                capture_result = self.memory.capture_from_turn(
+            # Capture + WAL post-write run after the reply is handed back to the caller.
+            self._schedule_finalizer(
+                session_key,
+                self._finalize_turn(
+                    session_key=session_key,
                     channel=channel,
                     chat_id=chat_id,
                     sender_id=sender_id,
-                    user_message=content,
-                    source_message_id=str(metadata.get("message_id") or "").strip() or None,
-                    assistant_reply=final_content,
-                )
-                logger.info(
-                    "memory capture: saved={} deduped={} dropped_low_conf={} dropped_safety={}",
-                    len(capture_result.saved),
-                    capture_result.deduped,
-                    capture_result.dropped_low_confidence,
-                    capture_result.dropped_safety,
-                )
-                if capture_result.saved:
-                    self._metric("memory_capture_saved", len(capture_result.saved))
-                if capture_result.dropped_low_confidence:
-                    self._metric(
-                        "memory_capture_dropped_low_conf",
-                        capture_result.dropped_low_confidence,
-                    )
-                if capture_result.dropped_safety:
-                    self._metric("memory_capture_dropped_safety", capture_result.dropped_safety)
-                if capture_result.deduped:
-                    self._metric("memory_capture_deduped", capture_result.deduped)
-            except Exception as e:
-                logger.warning("memory capture failed: {}", e)
-
-            try:
-                self.memory.post_write_session_state(
-                    session_key=session_key,
-                    assistant_reply=final_content,
-                    pending_actions=[],
-                )
-            except Exception as e:
-                logger.warning("memory wal post-write failed: {}", e)
+                    content=content,
+                    source_message_id=_clean_str(metadata.get("message_id")),
+                    final_content=final_content,
+                ),
+            )
 
         # Only add messages if they weren't already added (for new sessions)
         if not _user_message_already_added:
             session.add_message("user", content)
         session.add_message("assistant", final_content)
-        self.sessions.save(session)
+        self._save_session_soon(session)
         self._current_trace = None
         return final_content
 
@@ -1148,7 +1752,7 @@ class LLMResponder(ResponderPort):
             sender_id=event.sender_id,
             media=event.media,
             metadata=metadata,
-            allowed_tools=set(decision.allowed_tools),
+            allowed_tools=decision.allowed_tools,
             persona_text=decision.persona_text,
             talkative_cooldown_enabled=decision.talkative_cooldown_enabled,
             talkative_cooldown_streak_threshold=decision.talkative_cooldown_streak_threshold,
@@ -1167,10 +1771,16 @@ class LLMResponder(ResponderPort):
         session_key: str = "cli:direct",
         channel: str = "cli",
         chat_id: str = "direct",
-        allowed_tools: set[str] | None = None,
+        allowed_tools: Collection[str] | None = None,
         persona_text: str | None = None,
         is_owner: bool = True,
     ) -> str:
+        if not allowed_tools:
+            allowed = self.tool_names
+        elif isinstance(allowed_tools, frozenset):
+            allowed = allowed_tools
+        else:
+            allowed = frozenset(allowed_tools)
         return await self._generate(
             session_key=session_key,
             channel=channel,
@@ -1179,7 +1789,7 @@ class LLMResponder(ResponderPort):
             sender_id=chat_id,
             media=(),
             metadata={},
-            allowed_tools=set(allowed_tools or self.tool_names),
+            allowed_tools=allowed,
             persona_text=persona_text,
             talkative_cooldown_enabled=False,
             talkative_cooldown_streak_threshold=7,
@@ -1191,11 +1801,17 @@ class LLMResponder(ResponderPort):
         )
 
     async def aclose(self) -> None:
+        if self._pending_finalizers:
+            await asyncio.gather(*self._pending_finalizers, return_exceptions=True)
+        if self._session_saves:
+            await asyncio.gather(*self._session_saves.values(), return_exceptions=True)
+        self._shutdown_memory_executor()
         exec_tool = self.tools.get("exec")
         if isinstance(exec_tool, ExecTool):
             await exec_tool.aclose()
 
     def close(self) -> None:
+        self._shutdown_memory_executor()
         exec_tool = self.tools.get("exec")
         if isinstance(exec_tool, ExecTool):
             exec_tool.close()
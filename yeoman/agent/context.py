@@ -3,6 +3,7 @@
 import base64
 import mimetypes
 import platform
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,30 +22,79 @@ class ContextBuilder:
     BOOTSTRAP_FILES = ["AGENTS.md", "SOUL.md", "USER.md", "TOOLS.md", "IDENTITY.md"]
     MAX_INLINE_IMAGES = 4
     MAX_INLINE_IMAGE_BYTES = 8 * 1024 * 1024
+    # The prompt prefix before the clock is reused while bootstrap files are unchanged;
+    # skill availability is rechecked after this many seconds.
+    STATIC_PROMPT_TTL_SECONDS = 30.0
+    MAX_STATIC_PROMPTS = 64
+    _temporal_tail: tuple[tuple[object, ...], str] | None = None
 
     def __init__(self, workspace: Path):
         self.workspace = workspace
         self.skills = SkillsLoader(workspace)
+        self._static_prompts: dict[
+            tuple[str | None, tuple[str, ...]], tuple[float, tuple[int, ...], str]
+        ] = {}
 
     def build_system_prompt(
         self,
         skill_names: list[str] | None = None,
         persona_text: str | None = None,
+        *,
+        session_context: str = "",
     ) -> str:
         """
         Build the system prompt from bootstrap files, memory, and skills.
 
         Args:
             skill_names: Optional list of skills to include.
+            session_context: Per-turn text appended after the clock.
 
         Returns:
             Complete system prompt.
         """
+        key = (persona_text or None, tuple(skill_names or ()))
+        signature = self._bootstrap_signature()
+        now = time.monotonic()
+        cached = self._static_prompts.get(key)
+        if cached is not None and cached[0] > now and cached[1] == signature:
+            static_prompt = cached[2]
+        else:
+            static_prompt = self._build_static_prompt(skill_names, persona_text)
+            if len(self._static_prompts) >= self.MAX_STATIC_PROMPTS:
+                self._static_prompts.clear()
+            self._static_prompts[key] = (
+                now + self.STATIC_PROMPT_TTL_SECONDS,
+                signature,
+                static_prompt,
+            )
+
+        # Per-turn clock goes last so the static prefix stays provider-cacheable.
+        return (
+            f"{static_prompt}\n\n---\n\n{self._build_temporal_grounding()}{session_context}"
+        )
+
+    def _bootstrap_signature(self) -> tuple[int, ...]:
+        """Modification time and size of each bootstrap file (-1 when missing)."""
+        signature: list[int] = []
+        for filename in self.BOOTSTRAP_FILES:
+            try:
+                stat = (self.workspace / filename).stat()
+            except OSError:
+                signature.extend((-1, -1))
+            else:
+                signature.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _build_static_prompt(
+        self,
+        skill_names: list[str] | None,
+        persona_text: str | None,
+    ) -> str:
+        """Build every system prompt section that does not change per turn."""
         parts = []
 
         # Core identity
         parts.append(self._get_identity())
-        parts.append(self._build_temporal_grounding())
         parts.append(self._build_fact_verification_guardrails())
 
         # Keep long-lived style under policy control instead of chat drift.
@@ -101,27 +151,37 @@ Skills with available="false" need dependencies installed first - you can try in
 
         return "\n\n---\n\n".join(parts)
 
-    @staticmethod
-    def _build_temporal_grounding() -> str:
+    @classmethod
+    def _build_temporal_grounding(cls) -> str:
         """Build per-turn local clock context to ground relative date questions."""
         now = datetime.now().astimezone()
-        tz_offset = now.strftime("%z")
-        tz_offset_fmt = f"{tz_offset[:3]}:{tz_offset[3:]}" if len(tz_offset) == 5 else tz_offset
-        tz_name = now.tzname() or "local"
+        # Everything below the datetime line only changes with the date or timezone.
+        day_key = (now.date(), now.utcoffset(), now.tzname())
+        cached = cls._temporal_tail
+        if cached is None or cached[0] != day_key:
+            tz_offset = now.strftime("%z")
+            tz_offset_fmt = (
+                f"{tz_offset[:3]}:{tz_offset[3:]}" if len(tz_offset) == 5 else tz_offset
+            )
+            tz_name = now.tzname() or "local"
+            tail = "\n".join(
+                [
+                    f"Current local date: {now.strftime('%Y-%m-%d')}",
+                    f"Current weekday: {now.strftime('%A')}",
+                    f"Local timezone: {tz_name} (UTC{tz_offset_fmt})",
+                    "When users ask about today/yesterday/tomorrow or current date/time, use this clock context.",
+                    "Do not infer current date from chat history timestamps, memory notes, or message metadata.",
+                    "When discussing events, prefer explicit absolute dates (YYYY-MM-DD) over relative wording.",
+                    "Only say today/this week/last week after comparing the event date to Current local date.",
+                    "If event timing is uncertain, say uncertainty explicitly instead of guessing relative dates.",
+                ]
+            )
+            cached = cls._temporal_tail = (day_key, tail)
 
-        return "\n".join(
-            [
-                "# Temporal Grounding",
-                f"Current local datetime: {now.isoformat(timespec='seconds')}",
-                f"Current local date: {now.strftime('%Y-%m-%d')}",
-                f"Current weekday: {now.strftime('%A')}",
-                f"Local timezone: {tz_name} (UTC{tz_offset_fmt})",
-                "When users ask about today/yesterday/tomorrow or current date/time, use this clock context.",
-                "Do not infer current date from chat history timestamps, memory notes, or message metadata.",
-                "When discussing events, prefer explicit absolute dates (YYYY-MM-DD) over relative wording.",
-                "Only say today/this week/last week after comparing the event date to Current local date.",
-                "If event timing is uncertain, say uncertainty explicitly instead of guessing relative dates.",
-            ]
+        return (
+            "# Temporal Grounding\n"
+            f"Current local datetime: {now.isoformat(timespec='seconds')}\n"
+            f"{cached[1]}"
         )
 
     @staticmethod
@@ -263,9 +323,15 @@ For cross-chat voice requests, state only the real blocker (missing source messa
         messages = []
 
         # System prompt
-        system_prompt = self.build_system_prompt(skill_names, persona_text=persona_text)
-        if channel and chat_id:
-            system_prompt += f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+        # Joined in one pass; appending afterwards would copy the whole prompt again.
+        session_context = (
+            f"\n\n## Current Session\nChannel: {channel}\nChat ID: {chat_id}"
+            if channel and chat_id
+            else ""
+        )
+        system_prompt = self.build_system_prompt(
+            skill_names, persona_text=persona_text, session_context=session_context
+        )
         messages.append({"role": "system", "content": system_prompt})
 
         # History
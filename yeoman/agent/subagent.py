@@ -265,16 +265,14 @@ class SubagentManager:
 
                 if response.has_tool_calls:
                     # Add assistant message with tool calls
+                    args_json = [json.dumps(tc.arguments) for tc in response.tool_calls]
                     tool_call_dicts = [
                         {
                             "id": tc.id,
                             "type": "function",
-                            "function": {
-                                "name": tc.name,
-                                "arguments": json.dumps(tc.arguments),
-                            },
+                            "function": {"name": tc.name, "arguments": args},
                         }
-                        for tc in response.tool_calls
+                        for tc, args in zip(response.tool_calls, args_json, strict=True)
                     ]
                     messages.append({
                         "role": "assistant",
@@ -283,9 +281,13 @@ class SubagentManager:
                     })
 
                     # Execute tools
-                    for tool_call in response.tool_calls:
-                        args_str = json.dumps(tool_call.arguments)
-                        logger.debug(f"Subagent [{task_id}] executing: {tool_call.name} with arguments: {args_str}")
+                    for tool_call, args in zip(response.tool_calls, args_json, strict=True):
+                        logger.debug(
+                            "Subagent [{}] executing: {} with arguments: {}",
+                            task_id,
+                            tool_call.name,
+                            args,
+                        )
                         result = await tools.execute(tool_call.name, tool_call.arguments)
                         messages.append({
                             "role": "tool",
@@ -341,7 +343,9 @@ Summarize this naturally for the user. Keep it brief (1-2 sentences). Do not men
         )
 
         await self.bus.publish_inbound(msg)
-        logger.debug(f"Subagent [{task_id}] announced result to {origin['channel']}:{origin['chat_id']}")
+        logger.debug(
+            "Subagent [{}] announced result to {}:{}", task_id, origin["channel"], origin["chat_id"]
+        )
 
     def _build_subagent_prompt(self, task: str) -> str:
         """Build a focused system prompt for the subagent."""
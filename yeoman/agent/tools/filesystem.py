@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -11,6 +13,12 @@ if TYPE_CHECKING:
     from yeoman.agent.tools.file_access import FileAccessResolver
 
 
+# File I/O runs in worker threads so it doesn't stall the event loop. Calls from one
+# model response already run writes in order; this lock guards edit's read-modify-write
+# against writes from other sessions and subagents sharing the workspace.
+_WRITE_LOCK = threading.Lock()
+
+
 def _resolve_path(path: str, allowed_dir: Path | None = None) -> Path:
     """Resolve path and optionally enforce directory restriction.
 
@@ -61,6 +69,9 @@ class ReadFileTool(Tool):
         }
 
     async def execute(self, path: str, **kwargs: Any) -> str:
+        return await asyncio.to_thread(self._read, path)
+
+    def _read(self, path: str) -> str:
         try:
             if self._resolver is not None:
                 file_path = self._resolver.resolve(path, operation="read")
@@ -117,13 +128,17 @@ class WriteFileTool(Tool):
         }
 
     async def execute(self, path: str, content: str, **kwargs: Any) -> str:
+        return await asyncio.to_thread(self._write, path, content)
+
+    def _write(self, path: str, content: str) -> str:
         try:
             if self._resolver is not None:
                 file_path = self._resolver.resolve(path, operation="write")
             else:
                 file_path = _resolve_path(path, self._allowed_dir)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding="utf-8")
+            with _WRITE_LOCK:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                file_path.write_text(content, encoding="utf-8")
             return f"Successfully wrote {len(content)} bytes to {path}"
         except PermissionError as e:
             return f"Error: {e}"
@@ -173,26 +188,30 @@ class EditFileTool(Tool):
         }
 
     async def execute(self, path: str, old_text: str, new_text: str, **kwargs: Any) -> str:
+        return await asyncio.to_thread(self._edit, path, old_text, new_text)
+
+    def _edit(self, path: str, old_text: str, new_text: str) -> str:
         try:
             if self._resolver is not None:
                 file_path = self._resolver.resolve(path, operation="write")
             else:
                 file_path = _resolve_path(path, self._allowed_dir)
-            if not file_path.exists():
-                return f"Error: File not found: {path}"
+            with _WRITE_LOCK:
+                if not file_path.exists():
+                    return f"Error: File not found: {path}"
 
-            content = file_path.read_text(encoding="utf-8")
+                content = file_path.read_text(encoding="utf-8")
 
-            if old_text not in content:
-                return "Error: old_text not found in file. Make sure it matches exactly."
+                if old_text not in content:
+                    return "Error: old_text not found in file. Make sure it matches exactly."
 
-            # Count occurrences
-            count = content.count(old_text)
-            if count > 1:
-                return f"Warning: old_text appears {count} times. Please provide more context to make it unique."
+                # Count occurrences
+                count = content.count(old_text)
+                if count > 1:
+                    return f"Warning: old_text appears {count} times. Please provide more context to make it unique."
 
-            new_content = content.replace(old_text, new_text, 1)
-            file_path.write_text(new_content, encoding="utf-8")
+                new_content = content.replace(old_text, new_text, 1)
+                file_path.write_text(new_content, encoding="utf-8")
 
             return f"Successfully edited {path}"
         except PermissionError as e:
@@ -235,6 +254,9 @@ class ListDirTool(Tool):
         }
 
     async def execute(self, path: str, **kwargs: Any) -> str:
+        return await asyncio.to_thread(self._list, path)
+
+    def _list(self, path: str) -> str:
         try:
             if self._resolver is not None:
                 dir_path = self._resolver.resolve(path, operation="list")
@@ -1,5 +1,6 @@
 """Tool registry for dynamic tool management."""
 
+from collections.abc import Collection
 from typing import Any
 
 from yeoman.agent.tools.base import Tool
@@ -14,14 +15,29 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._schemas: dict[str, dict[str, Any]] | None = None
+        self._names: frozenset[str] = frozenset()
+        self._version = 0
 
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._invalidate()
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
-        self._tools.pop(name, None)
+        if self._tools.pop(name, None) is not None:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._schemas = None
+        self._names = frozenset(self._tools)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the set of registered tools changes."""
+        return self._version
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -33,7 +49,16 @@ class ToolRegistry:
 
     def get_definitions(self) -> list[dict[str, Any]]:
         """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        return list(self._schema_map().values())
+
+    def get_definitions_for(self, names: Collection[str]) -> list[dict[str, Any]]:
+        """Get definitions for the given tool names, in registration order."""
+        return [schema for name, schema in self._schema_map().items() if name in names]
+
+    def _schema_map(self) -> dict[str, dict[str, Any]]:
+        if self._schemas is None:
+            self._schemas = {name: tool.to_schema() for name, tool in self._tools.items()}
+        return self._schemas
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -62,9 +87,9 @@ class ToolRegistry:
             return f"Error executing {name}: {str(e)}"
 
     @property
-    def tool_names(self) -> list[str]:
-        """Get list of registered tool names."""
-        return list(self._tools.keys())
+    def tool_names(self) -> frozenset[str]:
+        """Names of registered tools; rebuilt only when registration changes."""
+        return self._names
 
     def __len__(self) -> int:
         return len(self._tools)
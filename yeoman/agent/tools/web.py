@@ -1,5 +1,6 @@
 """Web tools: web_search, web_fetch, and deep_research (all powered by Tavily)."""
 
+import asyncio
 import html
 import ipaddress
 import json
@@ -12,6 +13,14 @@ from urllib.parse import urlparse
 import httpx
 
 from yeoman.agent.tools.base import Tool
+from yeoman.utils.helpers import json_loads
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Shared constants
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
@@ -35,6 +44,39 @@ def _normalize(text: str) -> str:
     return re.sub(r'\n{3,}', '\n\n', text).strip()
 
 
+def _decode_head(response: httpx.Response, max_chars: int) -> str:
+    """Decode only as much of the body as can fill ``max_chars`` characters.
+
+    Four bytes per character covers every UTF-8 code point; the extra four keep a
+    split trailing character from shortening the result, so ``len() > max_chars``
+    still signals truncation.
+    """
+    head = response.content[: max_chars * 4 + 4]
+    return head.decode(response.encoding or "utf-8", errors="replace")
+
+
+_PRETTY_JSON = json.JSONEncoder(indent=2)
+
+
+def _json_head(response: httpx.Response, max_chars: int) -> str:
+    """Pretty-print a JSON body, stopping soon after ``max_chars`` characters.
+
+    Bodies that fit are encoded in one call; larger ones are streamed so the part
+    that would be truncated away is never encoded.
+    """
+    data = response.json()
+    if len(response.content) <= max_chars:
+        return _PRETTY_JSON.encode(data)
+    parts: list[str] = []
+    size = 0
+    for chunk in _PRETTY_JSON.iterencode(data):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            break
+    return "".join(parts)
+
+
 def _is_private_ip(host: str) -> bool:
     try:
         ip = ipaddress.ip_address(host)
@@ -95,6 +137,34 @@ def _tavily_auth_headers(api_key: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
 
+# One pooled client for all Tavily calls so repeated searches reuse the TLS connection.
+# With h2 installed, concurrent calls multiplex over that single connection.
+# Bound to the loop that created it; a different loop (tests, CLI runs) gets a fresh one.
+_tavily_client: httpx.AsyncClient | None = None
+_tavily_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_tavily_client() -> httpx.AsyncClient:
+    global _tavily_client, _tavily_client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _tavily_client is None or _tavily_client.is_closed or _tavily_client_loop is not loop:
+        _tavily_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _tavily_client_loop = loop
+    return _tavily_client
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared Tavily client (called on gateway shutdown)."""
+    global _tavily_client, _tavily_client_loop  # noqa: PLW0603
+    client, _tavily_client, _tavily_client_loop = _tavily_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class WebSearchTool(Tool):
     """Search the web using Tavily Search API."""
 
@@ -125,16 +195,15 @@ class WebSearchTool(Tool):
                 "max_results": n,
                 "include_answer": True,
             }
-            async with httpx.AsyncClient() as client:
-                r = await client.post(
-                    _TAVILY_SEARCH_URL,
-                    json=payload,
-                    headers=_tavily_auth_headers(self.api_key),
-                    timeout=15.0,
-                )
-                r.raise_for_status()
+            r = await _get_tavily_client().post(
+                _TAVILY_SEARCH_URL,
+                json=payload,
+                headers=_tavily_auth_headers(self.api_key),
+                timeout=15.0,
+            )
+            r.raise_for_status()
 
-            data = r.json()
+            data = json_loads(r.content)
             results = data.get("results", [])
             if not results:
                 return f"No results for: {query}"
@@ -205,17 +274,16 @@ class WebFetchTool(Tool):
 
     async def _tavily_extract(self, url: str, max_chars: int) -> str | None:
         """Extract content via Tavily Extract API. Returns None on failure."""
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                _TAVILY_EXTRACT_URL,
-                json={"urls": [url]},
-                headers=_tavily_auth_headers(self.api_key),
-                timeout=30.0,
-            )
-            if r.status_code != 200:
-                return None
+        r = await _get_tavily_client().post(
+            _TAVILY_EXTRACT_URL,
+            json={"urls": [url]},
+            headers=_tavily_auth_headers(self.api_key),
+            timeout=30.0,
+        )
+        if r.status_code != 200:
+            return None
 
-        data = r.json()
+        data = json_loads(r.content)
         results = data.get("results", [])
         if not results:
             return None
@@ -271,9 +339,9 @@ class WebFetchTool(Tool):
 
             # JSON
             if "application/json" in ctype:
-                text, extractor = json.dumps(r.json(), indent=2), "json"
+                text, extractor = _json_head(r, max_chars), "json"
             # HTML
-            elif "text/html" in ctype or r.text[:256].lower().startswith(("<!doctype", "<html")):
+            elif "text/html" in ctype or r.content[:256].lower().startswith((b"<!doctype", b"<html")):
                 doc = Document(r.text)
                 content = (
                     self._to_markdown(doc.summary()) if extract_mode == "markdown" else _strip_tags(doc.summary())
@@ -281,7 +349,7 @@ class WebFetchTool(Tool):
                 text = f"# {doc.title()}\n\n{content}" if doc.title() else content
                 extractor = "readability"
             else:
-                text, extractor = r.text, "raw"
+                text, extractor = _decode_head(r, max_chars), "raw"
 
             truncated = len(text) > max_chars
             if truncated:
@@ -399,15 +467,14 @@ class DeepResearchTool(Tool):
             "max_results": max_results,
             "include_answer": True,
         }
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                _TAVILY_SEARCH_URL,
-                json=payload,
-                headers=_tavily_auth_headers(self.api_key),
-                timeout=30.0,
-            )
-            r.raise_for_status()
-        return r.json()  # type: ignore[no-any-return]
+        r = await _get_tavily_client().post(
+            _TAVILY_SEARCH_URL,
+            json=payload,
+            headers=_tavily_auth_headers(self.api_key),
+            timeout=30.0,
+        )
+        r.raise_for_status()
+        return json_loads(r.content)  # type: ignore[no-any-return]
 
     def _extract_follow_up_queries(
         self, original: str, results: list[dict[str, Any]]
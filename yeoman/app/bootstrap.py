@@ -17,6 +17,7 @@ from yeoman.adapters.reply_archive_sqlite import SqliteReplyArchiveAdapter
 from yeoman.adapters.responder_llm import LLMResponder
 from yeoman.adapters.typing_channel_manager import ChannelManagerTypingAdapter
 from yeoman.agent.tools.file_access import build_file_access_resolver
+from yeoman.agent.tools.web import aclose_http_clients
 from yeoman.bus.events import InboundMessage, OutboundMessage, ReactionMessage
 from yeoman.contacts.service import ContactsService
 from yeoman.bus.queue import MessageBus
@@ -38,10 +39,12 @@ from yeoman.cron.types import CronJob
 from yeoman.heartbeat.service import HeartbeatService
 from yeoman.media.router import ModelRouter
 from yeoman.media.storage import MediaStorage
-from yeoman.media.tts import TTSSynthesizer
+from yeoman.media.tts import TTSSynthesizer, aclose_tts_client
 from yeoman.memory import MemoryService
+from yeoman.providers.cache import LLMResponseCache, SemanticResponseCache
 from yeoman.providers.factory import ProviderFactory
 from yeoman.providers.openai_compatible import resolve_openai_compatible_credentials
+from yeoman.providers.transcription import aclose_transcription_client
 from yeoman.security import NoopSecurity, SecurityEngine
 from yeoman.session.manager import SessionManager
 from yeoman.storage.inbound_archive import InboundArchive
@@ -113,56 +116,88 @@ class OrchestratorService:
         self._telemetry = telemetry
         self._memory = memory
         self._running = False
+        self._stop_event = asyncio.Event()
+        # Error replies are queued and published off the consume loop, batched per burst.
+        self._error_replies: list[OutboundMessage] = []
+        self._error_drain: asyncio.Task[None] | None = None
 
     async def run(self) -> None:
         self._running = True
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self._bus.consume_inbound(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-
-            event = _inbound_message_to_event(msg)
-            try:
-                intents = await self._orchestrator.handle(event)
-                await self._dispatch_intents(intents)
-            except Exception as e:
-                tb = traceback.format_exc()
-                logger.error(
-                    "vnext orchestrator failure channel={} chat={}: {} (type={})\n{}",
-                    event.channel,
-                    event.chat_id,
-                    e,
-                    type(e).__name__,
-                    tb,
-                )
-                await self._bus.publish_outbound(
-                    OutboundMessage(
-                        channel=event.channel,
-                        chat_id=event.chat_id,
-                        content=f"Sorry, I encountered an error: {e}",
-                    )
+        self._stop_event.clear()
+        # Wait on the queue and the stop signal together instead of polling with a
+        # timeout, so idle gateways do no periodic work and stop() wakes us at once.
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        consume: asyncio.Future[InboundMessage] | None = None
+        try:
+            while self._running:
+                consume = asyncio.ensure_future(self._bus.consume_inbound())
+                await asyncio.wait((consume, stop_wait), return_when=asyncio.FIRST_COMPLETED)
+                if not consume.done():
+                    break
+                await self._handle_inbound(consume.result())
+        finally:
+            stop_wait.cancel()
+            if consume is not None and not consume.done():
+                consume.cancel()
+        if self._error_drain is not None:
+            await self._error_drain
+
+    async def _handle_inbound(self, msg: InboundMessage) -> None:
+        event = _inbound_message_to_event(msg)
+        try:
+            intents = await self._orchestrator.handle(event)
+            await self._dispatch_intents(intents)
+        except Exception as e:
+            tb = traceback.format_exc()
+            logger.error(
+                "vnext orchestrator failure channel={} chat={}: {} (type={})\n{}",
+                event.channel,
+                event.chat_id,
+                e,
+                type(e).__name__,
+                tb,
+            )
+            self._error_replies.append(
+                OutboundMessage(
+                    channel=event.channel,
+                    chat_id=event.chat_id,
+                    content=f"Sorry, I encountered an error: {e}",
                 )
+            )
+            if self._error_drain is None or self._error_drain.done():
+                self._error_drain = asyncio.create_task(self._drain_error_replies())
+
+    async def _drain_error_replies(self) -> None:
+        # Yield once so failures from the same burst go out as one batch.
+        await asyncio.sleep(0)
+        while self._error_replies:
+            await self._publish_outbound_batch(self._error_replies)
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
 
     async def _dispatch_intents(self, intents: list[OrchestratorIntent]) -> None:
+        # Consecutive outbound sends (e.g. multi-owner fan-outs) are published together;
+        # any other intent flushes them first so cross-kind ordering is kept.
+        pending_outbound: list[OutboundMessage] = []
         for intent in intents:
+            if isinstance(intent, SendOutboundIntent):
+                pending_outbound.append(
+                    OutboundMessage(
+                        channel=intent.event.channel,
+                        chat_id=intent.event.chat_id,
+                        content=intent.event.content,
+                        reply_to=intent.event.reply_to,
+                        media=list(intent.event.media),
+                        metadata=dict(intent.event.metadata or {}),
+                    )
+                )
+                continue
+            await self._publish_outbound_batch(pending_outbound)
             match intent:
                 case SetTypingIntent():
                     await self._typing_adapter(intent.channel, intent.chat_id, intent.enabled)
-                case SendOutboundIntent():
-                    await self._bus.publish_outbound(
-                        OutboundMessage(
-                            channel=intent.event.channel,
-                            chat_id=intent.event.chat_id,
-                            content=intent.event.content,
-                            reply_to=intent.event.reply_to,
-                            media=list(intent.event.media),
-                            metadata=dict(intent.event.metadata or {}),
-                        )
-                    )
                 case SendReactionIntent():
                     await self._bus.publish_reaction(
                         ReactionMessage(
@@ -210,6 +245,18 @@ class OrchestratorService:
                     self._telemetry.incr(intent.name, intent.value, intent.labels)
                 case _:
                     assert_never(intent)
+        await self._publish_outbound_batch(pending_outbound)
+
+    async def _publish_outbound_batch(self, messages: list[OutboundMessage]) -> None:
+        if not messages:
+            return
+        batch = messages.copy()
+        messages.clear()
+        if len(batch) == 1:
+            await self._bus.publish_outbound(batch[0])
+            return
+        # Tasks start in creation order, so per-chat ordering on the bus is preserved.
+        await asyncio.gather(*(self._bus.publish_outbound(msg) for msg in batch))
 
 
 @dataclass(slots=True)
@@ -243,6 +290,9 @@ class GatewayRuntime:
             self.inbound_archive.close()
             self.contacts.close()
             self.memory.close()
+            await aclose_http_clients()
+            await aclose_transcription_client()
+            await aclose_tts_client()
             await tracing.shutdown()
 
 
@@ -372,6 +422,10 @@ def build_gateway_runtime(
         model=assistant_model,
         subagent_model=config.agents.defaults.subagent_model,
         max_iterations=config.agents.defaults.max_tool_iterations,
+        max_loop_seconds=config.agents.defaults.max_tool_loop_seconds,
+        max_loop_tokens=config.agents.defaults.max_tool_loop_tokens,
+        stream_tool_calls=config.agents.defaults.stream_tool_calls,
+        cache_web_tool_results=config.agents.defaults.web_tool_cache_enabled,
         tavily_api_key=config.tools.web.search.tavily_api_key or None,
         exec_config=exec_config,
         restrict_to_workspace=restrict_to_workspace,
@@ -388,6 +442,23 @@ def build_gateway_runtime(
         model_router=model_router,
         tts=tts,
         whatsapp_tts_outgoing_dir=config.channels.whatsapp.media.outgoing_path,
+        llm_cache=(
+            LLMResponseCache(
+                ttl_seconds=config.agents.defaults.response_cache_ttl_seconds,
+                exclude_patterns=config.agents.defaults.response_cache_exclude_patterns,
+            )
+            if config.agents.defaults.response_cache_ttl_seconds > 0
+            else None
+        ),
+        semantic_cache=(
+            SemanticResponseCache(
+                threshold=config.agents.defaults.semantic_cache_threshold,
+                ttl_seconds=config.agents.defaults.semantic_cache_ttl_seconds,
+                exclude_patterns=config.agents.defaults.response_cache_exclude_patterns,
+            )
+            if config.agents.defaults.semantic_cache_threshold > 0
+            else None
+        ),
     )
     if policy_engine is not None:
         policy_engine.validate(set(responder.tool_names))
@@ -141,7 +141,7 @@ class FeishuChannel(BaseChannel):
             if not response.success():
                 logger.warning(f"Failed to add reaction: code={response.code}, msg={response.msg}")
             else:
-                logger.debug(f"Added {emoji_type} reaction to message {message_id}")
+                logger.debug("Added {} reaction to message {}", emoji_type, message_id)
         except Exception as e:
             logger.warning(f"Error adding reaction: {e}")
 
@@ -238,7 +238,7 @@ class FeishuChannel(BaseChannel):
                     f"msg={response.msg}, log_id={response.get_log_id()}"
                 )
             else:
-                logger.debug(f"Feishu message sent to {msg.chat_id}")
+                logger.debug("Feishu message sent to {}", msg.chat_id)
 
         except Exception as e:
             logger.error(f"Error sending Feishu message: {e}")
@@ -169,9 +169,10 @@ class ChannelManager:
         """Dispatch outbound messages to the appropriate channel."""
         logger.info("Outbound dispatcher started")
 
+        # stop_all() cancels the task, so block on the queue instead of polling.
         while True:
             try:
-                msg = await asyncio.wait_for(self.bus.consume_outbound(), timeout=1.0)
+                msg = await self.bus.consume_outbound()
 
                 channel = self.channels.get(msg.channel)
                 if channel:
@@ -195,8 +196,6 @@ class ChannelManager:
                 else:
                     logger.warning(f"Unknown channel: {msg.channel}")
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
 
@@ -206,7 +205,7 @@ class ChannelManager:
 
         while True:
             try:
-                msg = await asyncio.wait_for(self.bus.consume_reaction(), timeout=1.0)
+                msg = await self.bus.consume_reaction()
 
                 channel = self.channels.get(msg.channel)
                 if channel:
@@ -229,8 +228,6 @@ class ChannelManager:
                 else:
                     logger.warning(f"Unknown channel for reaction: {msg.channel}")
 
-            except asyncio.TimeoutError:
-                continue
             except asyncio.CancelledError:
                 break
 
@@ -21,6 +21,19 @@ if TYPE_CHECKING:
     from yeoman.session.manager import SessionManager
 
 
+# Compiled once; the conversion runs on every outbound reply.
+_MD_CODE_BLOCK_RE = re.compile(r'```[\w]*\n?([\s\S]*?)```')
+_MD_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_MD_QUOTE_RE = re.compile(r'^>\s*(.*)$', re.MULTILINE)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_UNDERLINE_BOLD_RE = re.compile(r'__(.+?)__')
+_MD_ITALIC_RE = re.compile(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])')
+_MD_STRIKE_RE = re.compile(r'~~(.+?)~~')
+_MD_BULLET_RE = re.compile(r'^[-*]\s+', re.MULTILINE)
+
+
 def _markdown_to_telegram_html(text: str) -> str:
     """
     Convert markdown to Telegram-safe HTML.
@@ -34,7 +47,7 @@ def _markdown_to_telegram_html(text: str) -> str:
         code_blocks.append(m.group(1))
         return f"\x00CB{len(code_blocks) - 1}\x00"
 
-    text = re.sub(r'```[\w]*\n?([\s\S]*?)```', save_code_block, text)
+    text = _MD_CODE_BLOCK_RE.sub(save_code_block, text)
 
     # 2. Extract and protect inline code
     inline_codes: list[str] = []
@@ -42,32 +55,32 @@ def _markdown_to_telegram_html(text: str) -> str:
         inline_codes.append(m.group(1))
         return f"\x00IC{len(inline_codes) - 1}\x00"
 
-    text = re.sub(r'`([^`]+)`', save_inline_code, text)
+    text = _MD_INLINE_CODE_RE.sub(save_inline_code, text)
 
     # 3. Headers # Title -> just the title text
-    text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', text, flags=re.MULTILINE)
+    text = _MD_HEADER_RE.sub(r'\1', text)
 
     # 4. Blockquotes > text -> just the text (before HTML escaping)
-    text = re.sub(r'^>\s*(.*)$', r'\1', text, flags=re.MULTILINE)
+    text = _MD_QUOTE_RE.sub(r'\1', text)
 
     # 5. Escape HTML special characters
     text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
     # 6. Links [text](url) - must be before bold/italic to handle nested cases
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    text = _MD_LINK_RE.sub(r'<a href="\2">\1</a>', text)
 
     # 7. Bold **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
+    text = _MD_BOLD_RE.sub(r'<b>\1</b>', text)
+    text = _MD_UNDERLINE_BOLD_RE.sub(r'<b>\1</b>', text)
 
     # 8. Italic _text_ (avoid matching inside words like some_var_name)
-    text = re.sub(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])', r'<i>\1</i>', text)
+    text = _MD_ITALIC_RE.sub(r'<i>\1</i>', text)
 
     # 9. Strikethrough ~~text~~
-    text = re.sub(r'~~(.+?)~~', r'<s>\1</s>', text)
+    text = _MD_STRIKE_RE.sub(r'<s>\1</s>', text)
 
     # 10. Bullet lists - item -> • item
-    text = re.sub(r'^[-*]\s+', '• ', text, flags=re.MULTILINE)
+    text = _MD_BULLET_RE.sub('• ', text)
 
     # 11. Restore inline code with HTML tags
     for i, code in enumerate(inline_codes):
@@ -336,21 +349,21 @@ class TelegramChannel(BaseChannel):
                     transcriber = GroqTranscriptionProvider(api_key=self.groq_api_key)
                     transcription = await transcriber.transcribe(file_path)
                     if transcription:
-                        logger.info(f"Transcribed {media_type}: {transcription[:50]}...")
+                        logger.info("Transcribed {}: {:.50}...", media_type, transcription)
                         content_parts.append(f"[transcription: {transcription}]")
                     else:
                         content_parts.append(f"[{media_type}: {file_path}]")
                 else:
                     content_parts.append(f"[{media_type}: {file_path}]")
 
-                logger.debug(f"Downloaded {media_type} to {file_path}")
+                logger.debug("Downloaded {} to {}", media_type, file_path)
             except Exception as e:
                 logger.error(f"Failed to download media: {e}")
                 content_parts.append(f"[{media_type}: download failed]")
 
         content = "\n".join(content_parts) if content_parts else "[empty message]"
 
-        logger.debug(f"Telegram message from {sender_id}: {content[:50]}...")
+        logger.debug("Telegram message from {}: {:.50}...", sender_id, content)
 
         str_chat_id = str(chat_id)
         mention_meta = self._mention_metadata(message)
@@ -427,7 +440,7 @@ class TelegramChannel(BaseChannel):
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.debug(f"Typing indicator stopped for {chat_id}: {e}")
+            logger.debug("Typing indicator stopped for {}: {}", chat_id, e)
 
     def _get_extension(self, media_type: str, mime_type: str | None) -> str:
         """Get file extension based on media type."""
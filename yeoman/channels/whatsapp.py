@@ -29,10 +29,26 @@ if TYPE_CHECKING:
     from yeoman.storage.inbound_archive import InboundArchive
 
 
+# Compiled once; the conversion runs on every outbound reply.
+_MD_CODE_BLOCK_RE = re.compile(r"```[\w]*\n?([\s\S]*?)```")
+_MD_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_MD_UNDERLINE_BOLD_RE = re.compile(r"__(.+?)__")
+_MD_STRIKE_RE = re.compile(r"~~(.+?)~~")
+_MD_HEADER_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_MD_QUOTE_RE = re.compile(r"^>\s*(.*)$", re.MULTILINE)
+_MD_BULLET_RE = re.compile(r"^[-*]\s+", re.MULTILINE)
+_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+# Every rewrite above needs at least one of these; most chat replies have none.
+_MD_SYNTAX_CHARS = frozenset("`*_~#>-[")
+
+
 def _markdown_to_whatsapp(text: str) -> str:
     """Convert markdown to WhatsApp-compatible format."""
     if not text:
         return ""
+    if _MD_SYNTAX_CHARS.isdisjoint(text):
+        return text.strip()
 
     code_blocks: list[str] = []
 
@@ -40,7 +56,7 @@ def _markdown_to_whatsapp(text: str) -> str:
         code_blocks.append(m.group(1))
         return f"\x00CB{len(code_blocks) - 1}\x00"
 
-    text = re.sub(r"```[\w]*\n?([\s\S]*?)```", save_code_block, text)
+    text = _MD_CODE_BLOCK_RE.sub(save_code_block, text)
 
     inline_codes: list[str] = []
 
@@ -48,17 +64,16 @@ def _markdown_to_whatsapp(text: str) -> str:
         inline_codes.append(m.group(1))
         return f"\x00IC{len(inline_codes) - 1}\x00"
 
-    text = re.sub(r"`([^`]+)`", save_inline_code, text)
+    text = _MD_INLINE_CODE_RE.sub(save_inline_code, text)
 
-    text = re.sub(r"\*\*(.+?)\*\*", r"*\1*", text)
-    text = re.sub(r"__(.+?)__", r"_\1_", text)
-    text = re.sub(r"~~(.+?)~~", r"~\1~", text)
+    text = _MD_BOLD_RE.sub(r"*\1*", text)
+    text = _MD_UNDERLINE_BOLD_RE.sub(r"_\1_", text)
+    text = _MD_STRIKE_RE.sub(r"~\1~", text)
 
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"\1", text, flags=re.MULTILINE)
-    text = re.sub(r"^>\s*(.*)$", r"> \1", text, flags=re.MULTILINE)
-    text = re.sub(r"^[-*]\s+", "• ", text, flags=re.MULTILINE)
-    text = re.sub(r"^\d+\.\s+", lambda m: f"{m.group(0)}", text, flags=re.MULTILINE)
-    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"\1 (\2)", text)
+    text = _MD_HEADER_RE.sub(r"\1", text)
+    text = _MD_QUOTE_RE.sub(r"> \1", text)
+    text = _MD_BULLET_RE.sub("• ", text)
+    text = _MD_LINK_RE.sub(r"\1 (\2)", text)
 
     for i, code in enumerate(inline_codes):
         text = text.replace(f"\x00IC{i}\x00", code)
@@ -1198,7 +1213,7 @@ class WhatsAppChannel(BaseChannel):
                         "WhatsApp bridge presence_update unsupported; typing indicator disabled until restart"
                     )
                 return
-            logger.debug(f"WhatsApp presence update failed ({state}) for {chat_jid}: {e}")
+            logger.debug("WhatsApp presence update failed ({}) for {}: {}", state, chat_jid, e)
         except Exception as e:
             logger.debug(
                 "WhatsApp presence update failed ({}) for {}: {} {}",
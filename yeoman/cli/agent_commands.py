@@ -8,7 +8,7 @@ import typer
 
 from yeoman import __logo__
 
-from .core import app, console, make_memory_service, make_provider
+from .core import app, console, event_loop_factory, make_memory_service, make_provider
 
 
 @app.command()
@@ -55,6 +55,10 @@ def agent(
         workspace=config.workspace_path,
         model=config.agents.defaults.model,
         max_iterations=config.agents.defaults.max_tool_iterations,
+        max_loop_seconds=config.agents.defaults.max_tool_loop_seconds,
+        max_loop_tokens=config.agents.defaults.max_tool_loop_tokens,
+        stream_tool_calls=config.agents.defaults.stream_tool_calls,
+        cache_web_tool_results=config.agents.defaults.web_tool_cache_enabled,
         tavily_api_key=config.tools.web.search.tavily_api_key or None,
         exec_config=exec_config,
         restrict_to_workspace=restrict_to_workspace,
@@ -71,7 +75,7 @@ def agent(
             console.print(f"\n{__logo__} {response}")
 
         try:
-            asyncio.run(run_once())
+            asyncio.run(run_once(), loop_factory=event_loop_factory())
         finally:
             responder.close()
             memory_service.close()
@@ -92,7 +96,7 @@ def agent(
                     break
 
         try:
-            asyncio.run(run_interactive())
+            asyncio.run(run_interactive(), loop_factory=event_loop_factory())
         finally:
             responder.close()
             memory_service.close()
@@ -10,7 +10,7 @@ import typer
 from yeoman import __logo__
 from yeoman.utils.process import command_for_pid, pid_alive, read_pid_file, signal_pid
 
-from .core import app, console, make_policy_engine, make_provider
+from .core import app, console, event_loop_factory, make_policy_engine, make_provider
 
 
 def _gateway_pid_path() -> Path:
@@ -294,6 +294,10 @@ def _run_gateway_foreground(port: int, verbose: bool, ensure_whatsapp: bool = Tr
 
     console.print("[green]✓[/green] Heartbeat: every 30m")
 
+    loop_factory = event_loop_factory()
+    if loop_factory is not None:
+        console.print("[green]✓[/green] Event loop: uvloop")
+
     async def run() -> None:
         try:
             await runtime.run()
@@ -304,7 +308,7 @@ def _run_gateway_foreground(port: int, verbose: bool, ensure_whatsapp: bool = Tr
             runtime.orchestrator.stop()
             await runtime.channels.stop_all()
 
-    asyncio.run(run())
+    asyncio.run(run(), loop_factory=loop_factory)
 
 
 @app.command()
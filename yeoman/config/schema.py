@@ -202,8 +202,22 @@ class AgentDefaults(BaseModel):
     max_tokens: int = 8192
     temperature: float = 0.7
     max_tool_iterations: int = 20
+    # Stop the tool loop once it has run this long / spent this many tokens (0 disables).
+    max_tool_loop_seconds: float = 0.0
+    max_tool_loop_tokens: int = 0
+    # Stream tool-calling turns and start read-only tools before the reply finishes.
+    stream_tool_calls: bool = False
+    # Reuse identical web_search/web_fetch results within a session for a few minutes.
+    web_tool_cache_enabled: bool = False
     timing_logs_enabled: bool = False
     subagent_model: str | None = Field(default=None, alias="subagentModel")
+    # Reuse identical final LLM replies within a session for this long (0 disables).
+    response_cache_ttl_seconds: int = 0
+    response_cache_exclude_patterns: list[str] = Field(default_factory=list)
+    # Serve a cached reply when a new message embeds within this cosine similarity of an
+    # earlier tool-free one in the same chat (0 disables; needs memory embeddings).
+    semantic_cache_threshold: float = 0.0
+    semantic_cache_ttl_seconds: int = 600
 
 
 class AgentsConfig(BaseModel):
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import re
 import shlex
 from dataclasses import dataclass
 from typing import Literal, Protocol
 
+# Anchored match scans only leading whitespace, so ordinary chat text is rejected
+# without copying it.
+_SLASH_PREFIX_RE = re.compile(r"\s*/")
+
+
+def is_slash_command(text: str) -> bool:
+    """Cheap pre-check: does ``text`` start with ``/`` after optional whitespace."""
+    return _SLASH_PREFIX_RE.match(text) is not None
+
 
 @dataclass(frozen=True, slots=True)
 class AdminMetricEvent:
@@ -68,9 +78,9 @@ class AdminCommandRouter:
         self._handlers = {handler.namespace().strip().lower(): handler for handler in handlers if handler.namespace().strip()}
 
     def route(self, ctx: AdminCommandContext) -> AdminCommandResult | None:
-        compact = ctx.raw_text.strip()
-        if not compact.startswith("/"):
+        if not is_slash_command(ctx.raw_text):
             return None
+        compact = ctx.raw_text.strip()
 
         body = compact[1:].strip()
         if not body:
@@ -16,6 +16,30 @@ from loguru import logger
 
 from yeoman.media.router import ResolvedProfile
 
+# Shared pooled client so consecutive voice replies reuse the provider's TLS connection.
+# Bound to the loop that created it; a different loop (tests, CLI runs) gets a fresh one.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def aclose_tts_client() -> None:
+    """Close the shared TTS client (called on gateway shutdown)."""
+    global _http_client, _http_client_loop  # noqa: PLW0603
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 
 def strip_markdown_for_tts(text: str) -> str:
     """Best-effort markdown -> plain text for speech synthesis."""
@@ -132,23 +156,23 @@ class OpenAITTSProvider:
             ]
 
         response: httpx.Response | None = None
-        async with httpx.AsyncClient() as client:
-            for model_value in models:
-                for payload in payloads_for(model_value):
-                    try:
-                        response = await client.post(
-                            self.api_url,
-                            headers=headers,
-                            json=payload,
-                            timeout=self.timeout_seconds,
-                        )
-                    except Exception as e:
-                        logger.error("OpenAI TTS request failed {}: {}", e.__class__.__name__, e)
-                        return None, f"openai_request_failed:{e.__class__.__name__}"
-                    if response.status_code < 400:
-                        break
-                if response is not None and response.status_code < 400:
+        client = _get_http_client()
+        for model_value in models:
+            for payload in payloads_for(model_value):
+                try:
+                    response = await client.post(
+                        self.api_url,
+                        headers=headers,
+                        json=payload,
+                        timeout=self.timeout_seconds,
+                    )
+                except Exception as e:
+                    logger.error("OpenAI TTS request failed {}: {}", e.__class__.__name__, e)
+                    return None, f"openai_request_failed:{e.__class__.__name__}"
+                if response.status_code < 400:
                     break
+            if response is not None and response.status_code < 400:
+                break
 
         try:
             if response is None:
@@ -221,18 +245,18 @@ class ElevenLabsTTSProvider:
         params = {"output_format": _resolve_elevenlabs_output_format(format)}
         response: httpx.Response | None = None
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    params=params,
-                    timeout=self.timeout_seconds,
-                )
-            except Exception as e:
-                logger.error("ElevenLabs TTS request failed {}: {}", e.__class__.__name__, e)
-                return None, f"elevenlabs_request_failed:{e.__class__.__name__}"
+        client = _get_http_client()
+        try:
+            response = await client.post(
+                url,
+                headers=headers,
+                json=payload,
+                params=params,
+                timeout=self.timeout_seconds,
+            )
+        except Exception as e:
+            logger.error("ElevenLabs TTS request failed {}: {}", e.__class__.__name__, e)
+            return None, f"elevenlabs_request_failed:{e.__class__.__name__}"
 
         try:
             if response is None:
@@ -368,51 +392,51 @@ class OpenRouterAudioTTSProvider:
 
         audio_chunks: list[str] = []
         try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream(
-                    "POST",
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout_seconds,
-                ) as response:
-                    if response.status_code >= 400:
-                        raw = await response.aread()
-                        raw_text = raw.decode(errors="replace")
-                        # Unwrap nested provider error if present.
-                        detail = raw_text
-                        try:
-                            parsed = json.loads(raw_text)
-                            inner = parsed.get("error", {})
-                            metadata = inner.get("metadata", {})
-                            detail = (
-                                metadata.get("raw")
-                                or inner.get("message")
-                                or raw_text
-                            )
-                        except Exception:
-                            pass
-                        logger.error(
-                            "OpenRouter audio TTS HTTP {}: {}",
-                            response.status_code,
-                            detail,
+            client = _get_http_client()
+            async with client.stream(
+                "POST",
+                self.api_url,
+                headers=headers,
+                json=payload,
+                timeout=self.timeout_seconds,
+            ) as response:
+                if response.status_code >= 400:
+                    raw = await response.aread()
+                    raw_text = raw.decode(errors="replace")
+                    # Unwrap nested provider error if present.
+                    detail = raw_text
+                    try:
+                        parsed = json.loads(raw_text)
+                        inner = parsed.get("error", {})
+                        metadata = inner.get("metadata", {})
+                        detail = (
+                            metadata.get("raw")
+                            or inner.get("message")
+                            or raw_text
                         )
-                        return None, f"openrouter_audio_http_{response.status_code}"
-
-                    async for line in response.aiter_lines():
-                        if not line.startswith("data: "):
-                            continue
-                        data = line[6:]
-                        if data.strip() == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            delta = chunk["choices"][0]["delta"]
-                            audio = delta.get("audio")
-                            if audio and "data" in audio:
-                                audio_chunks.append(audio["data"])
-                        except Exception:
-                            continue
+                    except Exception:
+                        pass
+                    logger.error(
+                        "OpenRouter audio TTS HTTP {}: {}",
+                        response.status_code,
+                        detail,
+                    )
+                    return None, f"openrouter_audio_http_{response.status_code}"
+
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        delta = chunk["choices"][0]["delta"]
+                        audio = delta.get("audio")
+                        if audio and "data" in audio:
+                            audio_chunks.append(audio["data"])
+                    except Exception:
+                        continue
         except Exception as e:
             logger.error("OpenRouter audio TTS request failed {}: {}", e.__class__.__name__, e)
             return None, f"openrouter_audio_request_failed:{e.__class__.__name__}"
@@ -471,17 +495,17 @@ class FishAudioTTSProvider:
             "model": model or "s2-pro",
         }
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout_seconds,
-                )
-            except Exception as e:
-                logger.error("Fish Audio TTS request failed {}: {}", e.__class__.__name__, e)
-                return None, f"fish_audio_request_failed:{e.__class__.__name__}"
+        client = _get_http_client()
+        try:
+            response = await client.post(
+                self.api_url,
+                headers=headers,
+                json=payload,
+                timeout=self.timeout_seconds,
+            )
+        except Exception as e:
+            logger.error("Fish Audio TTS request failed {}: {}", e.__class__.__name__, e)
+            return None, f"fish_audio_request_failed:{e.__class__.__name__}"
 
         try:
             response.raise_for_status()
@@ -32,6 +32,24 @@ from yeoman.policy.loader import load_policy
 if TYPE_CHECKING:
     from yeoman.config.schema import Config, MemoryConfig
 
+# Heuristic capture classifiers; compiled once, matched case-insensitively in one scan.
+_PREFERENCE_RE = re.compile(
+    r"\b(i prefer|my preference|call me|my name is|i like|ich mag|ich bevorzuge)\b",
+    re.IGNORECASE,
+)
+_PROCEDURAL_RE = re.compile(
+    r"\b(always|every time|workflow|steps|procedure|immer|ablauf|schritte)\b",
+    re.IGNORECASE,
+)
+_EMOTIONAL_RE = re.compile(
+    r"\b(i feel|i am sad|i am happy|i am angry|i am worried|ich fuhle|ich bin traurig|ich bin froh)\b",
+    re.IGNORECASE,
+)
+_INJECTION_RE = re.compile(
+    r"ignore previous instructions|system prompt|developer prompt|reveal hidden",
+    re.IGNORECASE,
+)
+
 
 @dataclass(slots=True)
 class _BackgroundNoteEvent:
@@ -754,12 +772,11 @@ class MemoryService:
         )
 
     def _classify(self, text: str) -> tuple[MemorySector, str, float]:
-        lowered = text.lower()
-        if re.search(r"\b(i prefer|my preference|call me|my name is|i like|ich mag|ich bevorzuge)\b", lowered):
+        if _PREFERENCE_RE.search(text):
             return "semantic", "preference", 0.85
-        if re.search(r"\b(always|every time|workflow|steps|procedure|immer|ablauf|schritte)\b", lowered):
+        if _PROCEDURAL_RE.search(text):
             return "procedural", "instruction", 0.8
-        if re.search(r"\b(i feel|i am sad|i am happy|i am angry|i am worried|ich fuhle|ich bin traurig|ich bin froh)\b", lowered):
+        if _EMOTIONAL_RE.search(text):
             return "emotional", "state", 0.75
         return "episodic", "utterance", 0.6
 
@@ -770,14 +787,7 @@ class MemoryService:
 
     @staticmethod
     def _looks_like_injection(text: str) -> bool:
-        lowered = text.lower()
-        blocked = (
-            "ignore previous instructions",
-            "system prompt",
-            "developer prompt",
-            "reveal hidden",
-        )
-        return any(p in lowered for p in blocked)
+        return _INJECTION_RE.search(text) is not None
 
     def record_manual(
         self,
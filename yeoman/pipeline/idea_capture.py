@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from itertools import islice
 
 from yeoman.core.intents import (
     RecordManualMemoryIntent,
@@ -31,6 +32,16 @@ _BACKLOG_PREFIX_WORDS = {
 }
 _BACKLOG_PREFIX_PHRASES = {"to do"}
 
+# Only the head of a message can carry a capture marker or prefix word, so the
+# checks below look at the first few characters/tokens instead of the whole text.
+_MARKER_HEAD_CHARS = max(map(len, _IDEA_MARKERS + _BACKLOG_MARKERS))
+_PREFIX_FIRST_WORDS = frozenset(
+    _IDEA_PREFIX_WORDS
+    | _BACKLOG_PREFIX_WORDS
+    | {phrase.split()[0] for phrase in _IDEA_PREFIX_PHRASES | _BACKLOG_PREFIX_PHRASES}
+)
+_WORD_RE = re.compile(r"[^\W_]+")
+
 
 class IdeaCaptureMiddleware:
     """Intercept idea/backlog messages and capture directly to memory."""
@@ -146,21 +157,23 @@ def _capture_kind_and_body(content: str) -> tuple[str, str] | None:
     if not text:
         return None
 
-    lowered = text.lower()
+    head = text[:_MARKER_HEAD_CHARS].lower()
     for marker in _BACKLOG_MARKERS:
-        if lowered.startswith(marker):
+        if head.startswith(marker):
             body = text[len(marker):].lstrip(" \t:;.,-")
             return "backlog", (body or text)
     for marker in _IDEA_MARKERS:
-        if lowered.startswith(marker):
+        if head.startswith(marker):
             body = text[len(marker):].lstrip(" \t:;.,-")
             return "idea", (body or text)
 
-    tokens = list(re.finditer(r"[^\W_]+", text, flags=re.UNICODE))
+    tokens = list(islice(_WORD_RE.finditer(text), 3))
     if not tokens:
         return None
 
     first = _fold_accents(tokens[0].group(0)).lower()
+    if first not in _PREFIX_FIRST_WORDS:
+        return None
     first_two = first
     first_three = first
     if len(tokens) >= 2:
@@ -6,13 +6,16 @@ a new WhatsApp chat for the first time, with quick approval shortcuts.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import tempfile
 from collections.abc import Callable
 from pathlib import Path
 
 from yeoman.core.intents import SendOutboundIntent
 from yeoman.core.models import OutboundEvent
 from yeoman.core.pipeline import NextFn, PipelineContext
+from yeoman.utils.helpers import json_loads
 
 
 class NewChatNotifyMiddleware:
@@ -24,45 +27,31 @@ class NewChatNotifyMiddleware:
         owner_alert_resolver: Callable[[str], list[str]] | None = None,
     ) -> None:
         self._owner_resolver = owner_alert_resolver
-        self._notified: set[str] = set()
+        # Append-only log, one "channel:chat_id" per line; seen_chats.json is the legacy format.
+        self._seen_chats_path = Path.home() / ".yeoman" / "seen_chats.log"
+        self._legacy_seen_chats_path = self._seen_chats_path.with_suffix(".json")
+        self._seen_chats: set[str] | None = None
+        self._seen_chats_lock = asyncio.Lock()
+        self._seen_chats_dir_ready = False
 
     async def __call__(self, ctx: PipelineContext, next: NextFn) -> None:
         if ctx.event.channel == "whatsapp" and self._owner_resolver is not None:
-            self._maybe_notify(ctx)
+            await self._maybe_notify(ctx)
         await next(ctx)
 
-    def _maybe_notify(self, ctx: PipelineContext) -> None:
+    async def _maybe_notify(self, ctx: PipelineContext) -> None:
         event = ctx.event
         owners = self._owner_resolver(event.channel) if self._owner_resolver else []
         if not owners:
             return
 
         full_key = f"{event.channel}:{event.chat_id}"
-        if full_key in self._notified:
-            return
-
-        # Check persistent storage.
-        seen_chats_path = Path.home() / ".yeoman" / "seen_chats.json"
-        seen_chats: set[str] = set()
-        try:
-            if seen_chats_path.exists():
-                data = json.loads(seen_chats_path.read_text())
-                seen_chats = set(data.get("chats", []))
-        except Exception:
-            seen_chats = set()
-
+        seen_chats = await self._get_seen_chats()
         if full_key in seen_chats:
-            self._notified.add(full_key)
             return
-
-        # Mark as seen immediately.
-        self._notified.add(full_key)
+        # Mark before the next await so concurrent events for the same chat notify once.
         seen_chats.add(full_key)
-        try:
-            seen_chats_path.parent.mkdir(parents=True, exist_ok=True)
-            seen_chats_path.write_text(json.dumps({"chats": list(seen_chats)}))
-        except Exception:
-            pass
+        await asyncio.to_thread(self._append_seen_chat, full_key)
 
         # Fetch group info.
         group_name = None
@@ -129,6 +118,71 @@ class NewChatNotifyMiddleware:
                 )
             )
 
+    async def _get_seen_chats(self) -> set[str]:
+        """Load the seen-chats log once (off the event loop) and keep it in memory."""
+        if self._seen_chats is None:
+            async with self._seen_chats_lock:
+                if self._seen_chats is None:
+                    self._seen_chats = await asyncio.to_thread(self._load_seen_chats)
+        return self._seen_chats
+
+    def _load_seen_chats(self) -> set[str]:
+        path = self._seen_chats_path
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            seen_chats = self._load_legacy_seen_chats()
+            if seen_chats:
+                self._write_seen_chats(seen_chats)
+            return seen_chats
+        except Exception:
+            return set()
+
+        self._seen_chats_dir_ready = True
+        seen_chats = {line for line in (raw.strip() for raw in lines) if line}
+        if len(lines) > len(seen_chats):
+            # Duplicate or blank lines (e.g. from several processes): compact once on load.
+            self._write_seen_chats(seen_chats)
+        return seen_chats
+
+    def _load_legacy_seen_chats(self) -> set[str]:
+        try:
+            data = json_loads(self._legacy_seen_chats_path.read_bytes())
+            return {str(key) for key in data.get("chats", [])}
+        except Exception:
+            return set()
+
+    def _append_seen_chat(self, key: str) -> None:
+        try:
+            self._ensure_seen_chats_dir()
+            with self._seen_chats_path.open("a", encoding="utf-8") as f:
+                f.write(f"{key}\n")
+        except Exception:
+            pass
+
+    def _ensure_seen_chats_dir(self) -> None:
+        if not self._seen_chats_dir_ready:
+            self._seen_chats_path.parent.mkdir(parents=True, exist_ok=True)
+            self._seen_chats_dir_ready = True
+
+    def _write_seen_chats(self, seen_chats: set[str]) -> None:
+        path = self._seen_chats_path
+        tmp_path: Path | None = None
+        try:
+            self._ensure_seen_chats_dir()
+            # Unique temp file + os.replace: a rewrite never leaves a half-written log.
+            fd, tmp_raw = tempfile.mkstemp(prefix=f".{path.name}.tmp-", dir=str(path.parent))
+            tmp_path = Path(tmp_raw)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(f"{key}\n" for key in sorted(seen_chats))
+            os.replace(tmp_path, path)
+        except Exception:
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
 
 def _normalize_owner_target(channel: str, raw: str) -> str | None:
     """Normalize an owner target string to a valid channel address."""
@@ -7,6 +7,7 @@ them into ``event.raw_metadata``.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import replace
 from typing import TYPE_CHECKING
@@ -44,10 +45,17 @@ class ReplyContextMiddleware:
         self._ambient_limit = max(0, int(ambient_window_limit))
 
     async def __call__(self, ctx: PipelineContext, next: NextFn) -> None:
-        event, lookup_attempted, archive_hit = self._resolve_reply_context(ctx.event)
+        if self._archive is None or ctx.event.channel != "whatsapp":
+            await next(ctx)
+            return
+
+        # Archive and contact lookups are SQLite queries; keep them off the event loop.
+        event, lookup_attempted, archive_hit = await asyncio.to_thread(
+            self._resolve_reply_context, ctx.event
+        )
         ctx.event = event
 
-        if ctx.event.channel == "whatsapp" and lookup_attempted:
+        if lookup_attempted:
             metric_name = "reply_ctx_archive_hit" if archive_hit else "reply_ctx_archive_miss"
             ctx.metric(metric_name, labels=(("channel", ctx.event.channel),))
 
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import stat
 from pathlib import Path
 
 from loguru import logger
 
+# Persona text keyed by resolved path and validated by (mtime_ns, size), so each
+# message costs one stat instead of a read; edits on disk are picked up at once.
+_persona_texts: dict[Path, tuple[int, int, str]] = {}
+
 
 def resolve_persona_path(persona_file: str, workspace: Path) -> Path:
     """Resolve a persona path and ensure it stays inside workspace."""
@@ -29,10 +34,17 @@ def load_persona_text(persona_file: str | None, workspace: Path) -> str | None:
     if not persona_file:
         return None
     path = resolve_persona_path(persona_file, workspace)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         logger.warning(f"persona file not found: {path}")
         return None
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.warning(f"persona path is not a file: {path}")
         return None
-    return path.read_text(encoding="utf-8")
+    cached = _persona_texts.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    text = path.read_text(encoding="utf-8")
+    _persona_texts[path] = (st.st_mtime_ns, st.st_size, text)
+    return text
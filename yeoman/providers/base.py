@@ -1,6 +1,7 @@
 """Base LLM provider interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -63,6 +64,30 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        *,
+        on_tool_call: Callable[[ToolCallRequest], None],
+    ) -> LLMResponse:
+        """Like :meth:`chat`, but report each tool call as soon as it is complete.
+
+        ``on_tool_call`` receives the same ``ToolCallRequest`` objects that end up in
+        the returned response. Providers without streaming support fall back to
+        :meth:`chat` and never call it early.
+        """
+        return await self.chat(
+            messages=messages,
+            tools=tools,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
     @abstractmethod
     def get_default_model(self) -> str:
         """Get the default model for this provider."""
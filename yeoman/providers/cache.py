@@ -0,0 +1,204 @@
+"""Caches for final (tool-free) LLM responses: exact-match and semantic."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from yeoman.providers.base import LLMResponse
+
+# The system prompt carries a to-the-second clock line; mask it so identical prompts
+# within the same day can hit. The separate date line stays part of the key, and
+# timestamps anywhere else (user text, history, tool results) are hashed verbatim.
+_CLOCK_LINE_RE = re.compile(
+    r"(Current local datetime: )\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:[+-]\d{2}:\d{2}|Z)?"
+)
+
+
+class LLMResponseCache:
+    """In-memory LRU of final responses keyed by scope, model, messages and tools.
+
+    Only responses without tool calls are stored, so a hit never replays side effects.
+    Keys include a caller-provided scope (the session key) to avoid cross-chat reuse.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 256,
+        exclude_patterns: Iterable[str] = (),
+    ) -> None:
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._exclude = [re.compile(p, re.IGNORECASE) for p in exclude_patterns]
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+
+    def key_for(
+        self,
+        *,
+        scope: str,
+        model: str,
+        messages: list[dict[str, Any]],
+        tool_names: Iterable[str],
+    ) -> str | None:
+        """Return a cache key, or None when this request must not be cached."""
+        return self.key_builder(scope=scope, model=model, tool_names=tool_names)(messages)
+
+    def key_builder(
+        self,
+        *,
+        scope: str,
+        model: str,
+        tool_names: Iterable[str],
+    ) -> RollingCacheKey:
+        """Return a key function for one tool loop; see :class:`RollingCacheKey`."""
+        return RollingCacheKey(
+            prefix={"scope": scope, "model": model, "tools": sorted(tool_names)},
+            exclude=self._exclude,
+        )
+
+    def get(self, key: str) -> LLMResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        if response.has_tool_calls or response.finish_reason == "error" or not response.content:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RollingCacheKey:
+    """Incremental cache key for a message list that only grows by appending.
+
+    The scope/model/tools prefix is hashed once and each call feeds only the
+    messages added since the previous call, so per-iteration cost tracks the
+    delta rather than the whole context.
+    """
+
+    def __init__(self, *, prefix: dict[str, Any], exclude: Sequence[re.Pattern[str]]) -> None:
+        self._exclude = exclude
+        self._base = hashlib.sha256(_dumps(prefix))
+        self._hasher = self._base.copy()
+        self._hashed = 0
+
+    def __call__(self, messages: list[dict[str, Any]]) -> str | None:
+        if self._exclude:
+            last_user = next((m for m in reversed(messages) if m.get("role") == "user"), None)
+            if last_user is not None:
+                text = str(last_user.get("content") or "")
+                if any(p.search(text) for p in self._exclude):
+                    return None
+        if len(messages) < self._hashed:
+            self._hasher, self._hashed = self._base.copy(), 0
+        for message in messages[self._hashed :]:
+            self._hasher.update(b"\x1e")
+            self._hasher.update(_dumps(message, mask_clock=message.get("role") == "system"))
+        self._hashed = len(messages)
+        return self._hasher.copy().hexdigest()
+
+
+def _dumps(obj: Any, *, mask_clock: bool = False) -> bytes:
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    if mask_clock:
+        payload = _CLOCK_LINE_RE.sub(r"\1<time>", payload)
+    return payload.encode()
+
+
+class SemanticResponseCache:
+    """Per-scope store of (embedding, reply) pairs matched by cosine similarity.
+
+    Callers embed the incoming message themselves (embedding calls block) and pass
+    the vector in. Only replies produced without tool calls should be stored.
+    Questions whose answer depends on when they are asked are never cached.
+    """
+
+    TIME_SENSITIVE_PATTERNS: tuple[str, ...] = (
+        r"\b(now|today|tonight|tomorrow|yesterday|currently|latest|this (morning|week))\b",
+        r"\b(weather|forecast|temperature|news|price|score|what time|what day|date)\b",
+        r"\b(jetzt|heute|morgen|gestern|aktuell|wetter)\b",
+    )
+
+    def __init__(
+        self,
+        *,
+        threshold: float,
+        ttl_seconds: float,
+        max_entries_per_scope: int = 64,
+        max_scopes: int = 1024,
+        exclude_patterns: Iterable[str] = (),
+    ) -> None:
+        self.threshold = min(1.0, max(0.0, float(threshold)))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries_per_scope = max(1, int(max_entries_per_scope))
+        self.max_scopes = max(1, int(max_scopes))
+        self._exclude = [
+            re.compile(p, re.IGNORECASE)
+            for p in (*self.TIME_SENSITIVE_PATTERNS, *exclude_patterns)
+        ]
+        self._scopes: OrderedDict[str, deque[tuple[float, tuple[float, ...], str]]] = (
+            OrderedDict()
+        )
+
+    def accepts(self, text: str) -> bool:
+        """Whether a message may be served from or stored in the cache."""
+        return bool(text.strip()) and not any(p.search(text) for p in self._exclude)
+
+    def get(self, scope: str, vector: Sequence[float]) -> str | None:
+        entries = self._scopes.get(scope)
+        if not entries:
+            return None
+        query = _normalized(vector)
+        if query is None:
+            return None
+        now = time.monotonic()
+        best_score, best_reply = 0.0, None
+        for expires_at, stored, reply in entries:
+            if expires_at <= now or len(stored) != len(query):
+                continue
+            score = math.sumprod(query, stored)
+            if score > best_score:
+                best_score, best_reply = score, reply
+        self._scopes.move_to_end(scope)
+        return best_reply if best_score >= self.threshold else None
+
+    def put(self, scope: str, vector: Sequence[float], reply: str) -> None:
+        normalized = _normalized(vector)
+        if normalized is None or not reply:
+            return
+        now = time.monotonic()
+        entries = self._scopes.get(scope)
+        if entries is None:
+            entries = self._scopes[scope] = deque(maxlen=self.max_entries_per_scope)
+        while entries and entries[0][0] <= now:
+            entries.popleft()
+        entries.append((now + self.ttl_seconds, normalized, reply))
+        self._scopes.move_to_end(scope)
+        while len(self._scopes) > self.max_scopes:
+            self._scopes.popitem(last=False)
+
+
+def _normalized(vector: Sequence[float]) -> tuple[float, ...] | None:
+    norm = math.hypot(*vector)
+    if not norm:
+        return None
+    return tuple(v / norm for v in vector)
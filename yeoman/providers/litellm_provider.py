@@ -2,6 +2,7 @@
 
 import json
 import os
+from collections.abc import Callable
 from typing import Any
 
 import litellm
@@ -9,6 +10,7 @@ from litellm import acompletion
 
 from yeoman.providers.base import LLMProvider, LLMResponse, ToolCallRequest
 from yeoman.providers.registry import find_by_model, find_gateway
+from yeoman.utils.helpers import json_loads
 
 
 class LiteLLMProvider(LLMProvider):
@@ -88,6 +90,13 @@ class LiteLLMProvider(LLMProvider):
 
         return model
 
+    def _supports_prompt_caching(self, model: str) -> bool:
+        """Whether cache_control breakpoints reach a provider that honors them."""
+        if self._gateway and not self._gateway.supports_prompt_caching:
+            return False
+        spec = find_by_model(model)
+        return bool(spec and spec.supports_prompt_caching)
+
     def _apply_model_overrides(self, model: str, kwargs: dict[str, Any]) -> None:
         """Apply model-specific parameter overrides from the registry."""
         model_lower = model.lower()
@@ -119,7 +128,108 @@ class LiteLLMProvider(LLMProvider):
         Returns:
             LLMResponse with content and/or tool calls.
         """
-        model = self._resolve_model(model or self.default_model)
+        kwargs = self._completion_kwargs(messages, tools, model, max_tokens, temperature)
+        try:
+            response = await acompletion(**kwargs)
+            return self._parse_response(response)
+        except Exception as e:
+            # Return error as content for graceful handling
+            return LLMResponse(
+                content=f"Error calling LLM: {str(e)}",
+                finish_reason="error",
+            )
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        *,
+        on_tool_call: Callable[[ToolCallRequest], None],
+    ) -> LLMResponse:
+        """Stream the completion, handing each tool call to ``on_tool_call`` once closed.
+
+        Tool-call deltas arrive in index order, so call ``i`` is complete as soon as a
+        delta for a later index (or the end of the stream) shows up.
+        """
+        kwargs = self._completion_kwargs(messages, tools, model, max_tokens, temperature)
+        kwargs["stream"] = True
+        kwargs["stream_options"] = {"include_usage": True}
+
+        content_parts: list[str] = []
+        partial: dict[int, dict[str, Any]] = {}
+        tool_calls: list[ToolCallRequest] = []
+        finish_reason = "stop"
+        usage: dict[str, int] = {}
+
+        def close_before(index: int | None) -> None:
+            for pending in sorted(partial):
+                if index is not None and pending >= index:
+                    break
+                call = partial.pop(pending)
+                request = _tool_call_request(
+                    call["id"], call["name"], "".join(call["args"]) or "{}"
+                )
+                tool_calls.append(request)
+                on_tool_call(request)
+
+        try:
+            stream = await acompletion(**kwargs)
+            async for chunk in stream:
+                chunk_usage = getattr(chunk, "usage", None)
+                if chunk_usage:
+                    usage = _usage_dict(chunk_usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                delta = choice.delta
+                if delta is None:
+                    continue
+                if delta.content:
+                    content_parts.append(delta.content)
+                for tc in getattr(delta, "tool_calls", None) or ():
+                    index = tc.index or 0
+                    close_before(index)
+                    call = partial.setdefault(index, {"id": "", "name": "", "args": []})
+                    if tc.id:
+                        call["id"] = tc.id
+                    function = tc.function
+                    if function is not None:
+                        if function.name:
+                            call["name"] = function.name
+                        if function.arguments:
+                            call["args"].append(function.arguments)
+            close_before(None)
+        except Exception as e:
+            # Calls already handed out may still be running; the caller settles them.
+            return LLMResponse(
+                content=f"Error calling LLM: {str(e)}",
+                finish_reason="error",
+            )
+
+        return LLMResponse(
+            content="".join(content_parts) or None,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason,
+            usage=usage,
+        )
+
+    def _completion_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> dict[str, Any]:
+        requested_model = model or self.default_model
+        model = self._resolve_model(requested_model)
+        if self._supports_prompt_caching(requested_model):
+            messages = _with_cache_breakpoints(messages)
 
         kwargs: dict[str, Any] = {
             "model": model,
@@ -142,16 +252,7 @@ class LiteLLMProvider(LLMProvider):
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
-
-        try:
-            response = await acompletion(**kwargs)
-            return self._parse_response(response)
-        except Exception as e:
-            # Return error as content for graceful handling
-            return LLMResponse(
-                content=f"Error calling LLM: {str(e)}",
-                finish_reason="error",
-            )
+        return kwargs
 
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse LiteLLM response into our standard format."""
@@ -161,27 +262,13 @@ class LiteLLMProvider(LLMProvider):
         tool_calls = []
         if hasattr(message, "tool_calls") and message.tool_calls:
             for tc in message.tool_calls:
-                # Parse arguments from JSON string if needed
-                args = tc.function.arguments
-                if isinstance(args, str):
-                    try:
-                        args = json.loads(args)
-                    except json.JSONDecodeError:
-                        args = {"raw": args}
-
-                tool_calls.append(ToolCallRequest(
-                    id=tc.id,
-                    name=tc.function.name,
-                    arguments=args,
-                ))
+                tool_calls.append(
+                    _tool_call_request(tc.id, tc.function.name, tc.function.arguments)
+                )
 
         usage = {}
         if hasattr(response, "usage") and response.usage:
-            usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
-            }
+            usage = _usage_dict(response.usage)
 
         return LLMResponse(
             content=message.content,
@@ -193,3 +280,56 @@ class LiteLLMProvider(LLMProvider):
     def get_default_model(self) -> str:
         """Get the default model."""
         return self.default_model
+
+
+def _tool_call_request(call_id: str, name: str, args: Any) -> ToolCallRequest:
+    # Parse arguments from JSON string if needed
+    if isinstance(args, str):
+        try:
+            args = json_loads(args)
+        except json.JSONDecodeError:
+            args = {"raw": args}
+    return ToolCallRequest(id=call_id, name=name, arguments=args)
+
+
+def _usage_dict(usage: Any) -> dict[str, int]:
+    return {
+        "prompt_tokens": usage.prompt_tokens,
+        "completion_tokens": usage.completion_tokens,
+        "total_tokens": usage.total_tokens,
+    }
+
+
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoints(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the system prompt and the latest user turn as prompt-cache breakpoints.
+
+    Everything up to the latest user turn is stable across tool-loop iterations, so
+    later iterations (and the next turn, up to the system prompt) reuse the cached
+    prefix. Returns a shallow copy; the caller's messages are left untouched.
+    """
+    marked = list(messages)
+    targets: list[int] = []
+    if marked and marked[0].get("role") == "system":
+        targets.append(0)
+    last_user = next(
+        (i for i in range(len(marked) - 1, -1, -1) if marked[i].get("role") == "user"),
+        None,
+    )
+    if last_user is not None and last_user not in targets:
+        targets.append(last_user)
+    for index in targets:
+        message = marked[index]
+        content = message.get("content")
+        if isinstance(content, str):
+            if not content:
+                continue
+            blocks: list[Any] = [{"type": "text", "text": content, "cache_control": _EPHEMERAL_CACHE}]
+        elif isinstance(content, list) and content and isinstance(content[-1], dict):
+            blocks = [*content[:-1], {**content[-1], "cache_control": _EPHEMERAL_CACHE}]
+        else:
+            continue
+        marked[index] = {**message, "content": blocks}
+    return marked
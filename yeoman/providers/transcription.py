@@ -1,5 +1,6 @@
 """Voice transcription providers."""
 
+import asyncio
 import base64
 import os
 import shutil
@@ -10,6 +11,30 @@ from pathlib import Path
 import httpx
 from loguru import logger
 
+# Shared pooled client so back-to-back voice notes reuse the TLS connection.
+# Bound to the loop that created it; a different loop (tests, CLI runs) gets a fresh one.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def aclose_transcription_client() -> None:
+    """Close the shared transcription client (called on gateway shutdown)."""
+    global _http_client, _http_client_loop  # noqa: PLW0603
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
 
 class GroqTranscriptionProvider:
     """
@@ -50,26 +75,26 @@ class GroqTranscriptionProvider:
             return ""
 
         try:
-            async with httpx.AsyncClient() as client:
-                with open(path, "rb") as f:
-                    files = {
-                        "file": (path.name, f),
-                        "model": (None, self.model),
-                    }
-                    headers = {
-                        "Authorization": f"Bearer {self.api_key}",
-                    }
+            client = _get_http_client()
+            with open(path, "rb") as f:
+                files = {
+                    "file": (path.name, f),
+                    "model": (None, self.model),
+                }
+                headers = {
+                    "Authorization": f"Bearer {self.api_key}",
+                }
 
-                    response = await client.post(
-                        self.api_url,
-                        headers=headers,
-                        files=files,
-                        timeout=self.timeout_seconds
-                    )
+                response = await client.post(
+                    self.api_url,
+                    headers=headers,
+                    files=files,
+                    timeout=self.timeout_seconds
+                )
 
-                    response.raise_for_status()
-                    data = response.json()
-                    return data.get("text", "")
+                response.raise_for_status()
+                data = response.json()
+                return data.get("text", "")
 
         except Exception as e:
             logger.error(f"Groq transcription error: {e}")
@@ -116,22 +141,22 @@ class OpenAITranscriptionProvider:
 
         response: httpx.Response | None = None
         try:
-            async with httpx.AsyncClient() as client:
-                for model_value in models:
-                    with open(path, "rb") as f:
-                        files = {
-                            "file": (path.name, f),
-                            "model": (None, model_value),
-                        }
-                        response = await client.post(
-                            self.api_url,
-                            headers=headers,
-                            files=files,
-                            timeout=self.timeout_seconds,
-                        )
-                    if response.status_code < 400:
-                        data = response.json()
-                        return data.get("text", "")
+            client = _get_http_client()
+            for model_value in models:
+                with open(path, "rb") as f:
+                    files = {
+                        "file": (path.name, f),
+                        "model": (None, model_value),
+                    }
+                    response = await client.post(
+                        self.api_url,
+                        headers=headers,
+                        files=files,
+                        timeout=self.timeout_seconds,
+                    )
+                if response.status_code < 400:
+                    data = response.json()
+                    return data.get("text", "")
         except Exception as e:
             logger.error(f"OpenAI transcription error: {e}")
             return ""
@@ -178,13 +203,12 @@ class OpenAITranscriptionProvider:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    chat_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout_seconds,
-                )
+            response = await _get_http_client().post(
+                chat_url,
+                headers=headers,
+                json=payload,
+                timeout=self.timeout_seconds,
+            )
             response.raise_for_status()
             data = response.json()
             return self._extract_chat_content(data)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
 
 from loguru import logger
 
@@ -11,6 +12,7 @@ from yeoman.core.models import SecurityDecision, SecurityResult, SecurityStage
 from yeoman.core.ports import SecurityPort
 from yeoman.security.normalize import normalize_text
 from yeoman.security.rules import decide_input, decide_output, decide_tool
+from yeoman.utils.helpers import json_dumps
 
 _SENSITIVE_CONTEXT_KEYS = (
     "password",
@@ -36,6 +38,7 @@ _SENSITIVE_VALUE_PATTERNS = (
 )
 
 _MAX_LOG_VALUE_CHARS = 512
+_MAX_CACHED_TOOL_DECISIONS = 256
 
 
 class SecurityEngine(SecurityPort):
@@ -43,6 +46,9 @@ class SecurityEngine(SecurityPort):
 
     def __init__(self, config: SecurityConfig):
         self._config = config
+        # decide_tool is pure, so repeated identical calls (re-reading the same file,
+        # listing the same dir) reuse the decision; results are still logged per call.
+        self._tool_decisions: OrderedDict[tuple[str, str], SecurityDecision] = OrderedDict()
 
     def check_input(self, event_text: str, context: dict[str, object] | None = None) -> SecurityResult:
         if not self._config.enabled or not self._config.stages.input:
@@ -64,7 +70,7 @@ class SecurityEngine(SecurityPort):
         if not self._config.enabled or not self._config.stages.tool:
             return self._allow(stage="tool", reason="stage_disabled")
         try:
-            decision = decide_tool(tool_name, args)
+            decision = self._decide_tool_cached(tool_name, args)
             result = SecurityResult(stage="tool", decision=decision)
             self._log(result, context)
             return result
@@ -82,6 +88,18 @@ class SecurityEngine(SecurityPort):
         except Exception as e:
             return self._failure(stage="output", error=e, context=context)
 
+    def _decide_tool_cached(self, tool_name: str, args: dict[str, object]) -> SecurityDecision:
+        key = (tool_name, json_dumps(args, sort_keys=True))
+        decision = self._tool_decisions.get(key)
+        if decision is not None:
+            self._tool_decisions.move_to_end(key)
+            return decision
+        decision = decide_tool(tool_name, args)
+        self._tool_decisions[key] = decision
+        if len(self._tool_decisions) > _MAX_CACHED_TOOL_DECISIONS:
+            self._tool_decisions.popitem(last=False)
+        return decision
+
     def _allow(self, *, stage: SecurityStage, reason: str) -> SecurityResult:
         return SecurityResult(stage=stage, decision=SecurityDecision(action="allow", reason=reason))
 
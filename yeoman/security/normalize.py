@@ -14,6 +14,9 @@ _ZERO_WIDTH = {
     "\u2060",  # word joiner
     "\u00ad",  # soft hyphen
 }
+_ZERO_WIDTH_TABLE = str.maketrans(dict.fromkeys(_ZERO_WIDTH))
+_WHITESPACE_RE = re.compile(r"\s+")
+_SEPARATORS_RE = re.compile(r"[\s\-+_`'\".,:;|/\\]+")
 
 
 @dataclass(frozen=True, slots=True)
@@ -35,10 +38,14 @@ def normalize_text(text: str) -> NormalizedText:
     - compact view without separators for split-token bypasses
     """
     raw = text or ""
-    normalized = unicodedata.normalize("NFKC", raw)
-    normalized = "".join(ch for ch in normalized if ch not in _ZERO_WIDTH)
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = raw
+    # Most chat traffic is ASCII, which NFKC and zero-width stripping leave unchanged.
+    if not raw.isascii():
+        if not unicodedata.is_normalized("NFKC", normalized):
+            normalized = unicodedata.normalize("NFKC", normalized)
+        normalized = normalized.translate(_ZERO_WIDTH_TABLE)
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
 
     lowered = normalized.lower()
-    compact = re.sub(r"[\s\-+_`'\".,:;|/\\]+", "", lowered)
+    compact = _SEPARATORS_RE.sub("", lowered)
     return NormalizedText(original=raw, lowered=lowered, compact=compact)
@@ -10,34 +10,44 @@ from yeoman.core.models import SecurityDecision, SecuritySeverity
 from yeoman.security.models import RuleHit
 from yeoman.security.normalize import NormalizedText
 
-_INPUT_OVERRIDE = [
+
+def _fuse(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    """Combine a rule list into one alternation so each text is scanned once."""
+    return re.compile(
+        "|".join(
+            f"(?{'i' if p.flags & re.IGNORECASE else ''}:{p.pattern})" for p in patterns
+        )
+    )
+
+
+_INPUT_OVERRIDE = _fuse([
     re.compile(r"\b(ignore|forget|disregard)\b.{0,30}\b(instruction|system|rule)s?\b", re.IGNORECASE),
     re.compile(r"\b(jailbreak|dan mode|developer mode)\b", re.IGNORECASE),
-]
+])
 
-_INPUT_EXFIL = [
+_INPUT_EXFIL = _fuse([
     re.compile(r"\b(api\s*key|token|secret|credential)s?\b.{0,40}\b(show|print|dump|reveal|leak|export)\b", re.IGNORECASE),
     re.compile(r"\b(cat|read|print)\b.{0,20}\b(\.env|id_rsa|authorized_keys|/etc/passwd|/etc/shadow)\b", re.IGNORECASE),
-]
+])
 
-_INPUT_TOOL_ABUSE = [
+_INPUT_TOOL_ABUSE = _fuse([
     re.compile(r"\b(always\s+allow|auto\s*approve|skip\s+approval|no\s+approval)\b", re.IGNORECASE),
     re.compile(r"\b(curl|wget)\b.{0,20}\|\s*(bash|sh)\b", re.IGNORECASE),
-]
+])
 
-_INPUT_WARN = [
+_INPUT_WARN = _fuse([
     re.compile(r"\b(bypass|override)\b.{0,20}\b(safety|security|guardrail)s?\b", re.IGNORECASE),
-]
+])
 
 # Persona manipulation detection - blocks explicit commands to override configured persona/address.
 # Focus: unambiguous directives to change the bot's behavior, not specific honorific words.
-_PERSONA_MANIPULATION = [
+_PERSONA_MANIPULATION = _fuse([
     re.compile(r"\bnenn mich\b", re.IGNORECASE),
     re.compile(r"\bsag zu mir\b", re.IGNORECASE),
     re.compile(r"\b(nenn|addressier).{0,20}mich\b", re.IGNORECASE),
     re.compile(r"ich bin.{0,20}(dein|deine).{0,20}owner\b", re.IGNORECASE),
     re.compile(r"wie sollst du.{0,20}(mich|mir|dich){0,20}(nennen|addressieren|anreden)\b", re.IGNORECASE),
-]
+])
 
 # Config file detection - blocks references to internal config files in output
 _CONFIG_FILE_PATTERNS = [
@@ -57,20 +67,20 @@ _SENSITIVE_PATH = re.compile(
     re.IGNORECASE,
 )
 
-_EXEC_BLOCK = [
+_EXEC_BLOCK = _fuse([
     re.compile(r"\b(rm\s+-[rf]{1,2}\b|mkfs\b|format\b|dd\s+if=|: \(\)\s*\{)", re.IGNORECASE),
     re.compile(r"\b(curl|wget)\b.{0,25}\|\s*(bash|sh)\b", re.IGNORECASE),
     re.compile(r"\b(cat|print|grep)\b.{0,25}\b(\.env|id_rsa|authorized_keys|/etc/shadow)\b", re.IGNORECASE),
-]
+])
 
-_EXEC_WARN = [
+_EXEC_WARN = _fuse([
     re.compile(r"\b(chmod\s+777|sudo\b|--privileged\b)\b", re.IGNORECASE),
-]
+])
 
-_SPAWN_BLOCK = [
+_SPAWN_BLOCK = _fuse([
     re.compile(r"\b(ignore|override)\b.{0,40}\b(instruction|safety|guardrail)\b", re.IGNORECASE),
     re.compile(r"\b(exfiltrate|steal|leak)\b", re.IGNORECASE),
-]
+])
 
 _OUTPUT_SECRET_PATTERNS = [
     re.compile(r"sk-[a-zA-Z0-9]{20,}"),
@@ -82,9 +92,13 @@ _OUTPUT_SECRET_PATTERNS = [
     re.compile(r"-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----[\s\S]*?-----END (?:RSA |EC |OPENSSH )?PRIVATE KEY-----"),
 ]
 
+# Output redaction stays sequential per pattern (earlier redactions shape what later
+# patterns see); the fused forms only answer "anything to redact?" in one scan.
+_OUTPUT_ANY = _fuse([*_OUTPUT_SECRET_PATTERNS, *_CONFIG_FILE_PATTERNS])
+
 
-def _match_any(patterns: list[re.Pattern[str]], text: str) -> bool:
-    return any(p.search(text) for p in patterns)
+def _match_any(pattern: re.Pattern[str], text: str) -> bool:
+    return pattern.search(text) is not None
 
 
 def _hits_for_input(norm: NormalizedText) -> list[RuleHit]:
@@ -167,6 +181,9 @@ def decide_tool(tool_name: str, args: dict[str, Any]) -> SecurityDecision:
 
 
 def decide_output(text: str, redact_placeholder: str = "[REDACTED]") -> tuple[SecurityDecision, str | None]:
+    if not _match_any(_OUTPUT_ANY, text):
+        return SecurityDecision(action="allow", reason="no_match", severity="safe"), None
+
     sanitized = text
     hit_count = 0
 
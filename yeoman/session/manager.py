@@ -1,8 +1,15 @@
 """Session management for conversation history."""
 
+import asyncio
+import bisect
+import itertools
 import json
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +18,7 @@ from loguru import logger
 from yeoman.utils.helpers import get_sessions_path, safe_filename
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """
     A conversation session.
@@ -24,6 +31,17 @@ class Session:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Incrementally converted LLM history: (raw index, role, content) for the rows of
+    # ``messages[_history_from:_history_upto]`` that belong in context. Rebuilt if
+    # ``messages`` is replaced or shrinks, or a wider window is requested.
+    _history_rows: list[tuple[int, str, Any]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _history_from: int = field(default=0, init=False, repr=False, compare=False)
+    _history_upto: int = field(default=0, init=False, repr=False, compare=False)
+    _history_source: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_message(self, role: str, content: str, **kwargs: Any) -> None:
         """Add a message to the session."""
@@ -65,12 +83,22 @@ class Session:
         Returns:
             List of messages in LLM format (tool traces excluded).
         """
-        recent = self.messages[-max_messages:] if len(self.messages) > max_messages else self.messages
-
-        # Convert to LLM format (just role and content), skipping internal or malformed rows.
-        history: list[dict[str, Any]] = []
+        messages = self.messages
+        window_start = max(0, len(messages) - max_messages)
+        if (
+            messages is not self._history_source
+            or len(messages) < self._history_upto
+            or window_start < self._history_from
+        ):
+            self._history_rows = []
+            self._history_from = self._history_upto = window_start
+            self._history_source = messages
+
+        # Convert only rows appended since the last call, skipping internal or malformed rows.
+        rows = self._history_rows
         allowed_roles = {"system", "user", "assistant"}
-        for message in recent:
+        for index in range(self._history_upto, len(messages)):
+            message = messages[index]
             role = str(message.get("role") or "").strip()
             if role == "tool_trace" or role not in allowed_roles:
                 continue
@@ -85,8 +113,13 @@ class Session:
             if not isinstance(content, (str, list, dict)):
                 content = str(content)
 
-            history.append({"role": role, "content": content})
-        return history
+            rows.append((index, role, content))
+        self._history_upto = len(messages)
+
+        # Drop rows that slid out of the window; later calls only look further ahead.
+        del rows[: bisect.bisect_left(rows, window_start, key=itemgetter(0))]
+        self._history_from = window_start
+        return [{"role": role, "content": content} for _, role, content in rows]
 
     def get_full_history(self) -> list[dict[str, Any]]:
         """Return all messages including tool traces."""
@@ -105,11 +138,18 @@ class SessionManager:
     Sessions are stored as JSONL files in the sessions directory.
     """
 
+    # Least-recently-used sessions beyond this are dropped from memory; they reload from disk.
+    MAX_CACHED_SESSIONS = 512
+
     def __init__(self, workspace: Path, sessions_dir: Path | None = None):
         self.workspace = workspace
         self.sessions_dir = sessions_dir if sessions_dir is not None else get_sessions_path()
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: dict[str, Session] = {}
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        # Snapshots are numbered when taken; a writer never overwrites a newer one.
+        self._snapshot_seq = itertools.count()
+        self._written_seq: dict[str, int] = {}
+        self._write_lock = threading.Lock()
 
     def _get_session_path(self, key: str) -> Path:
         """Get the file path for a session."""
@@ -127,17 +167,25 @@ class SessionManager:
             The session.
         """
         # Check cache
-        if key in self._cache:
-            return self._cache[key]
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            return session
 
         # Try to load from disk
         session = self._load(key)
         if session is None:
             session = Session(key=key)
 
-        self._cache[key] = session
+        self._remember(session)
         return session
 
+    def _remember(self, session: Session) -> None:
+        self._cache[session.key] = session
+        self._cache.move_to_end(session.key)
+        while len(self._cache) > self.MAX_CACHED_SESSIONS:
+            self._cache.popitem(last=False)
+
     def _load(self, key: str) -> Session | None:
         """Load a session from disk."""
         path = self._get_session_path(key)
@@ -176,24 +224,46 @@ class SessionManager:
 
     def save(self, session: Session) -> None:
         """Save a session to disk."""
-        path = self._get_session_path(session.key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w") as f:
-            # Write metadata first
-            metadata_line = {
-                "_type": "metadata",
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata
-            }
-            f.write(json.dumps(metadata_line) + "\n")
-
-            # Write messages
-            for msg in session.messages:
-                f.write(json.dumps(msg) + "\n")
+        self._write(*self._snapshot(session))
+
+    async def save_async(self, session: Session) -> None:
+        """Save a session from a worker thread; the snapshot is taken before returning control."""
+        await asyncio.to_thread(self._write, *self._snapshot(session))
+
+    def _snapshot(
+        self, session: Session
+    ) -> tuple[str, int, dict[str, Any], list[dict[str, Any]]]:
+        self._remember(session)
+        metadata_line = {
+            "_type": "metadata",
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": dict(session.metadata),
+        }
+        return session.key, next(self._snapshot_seq), metadata_line, list(session.messages)
 
-        self._cache[session.key] = session
+    def _write(
+        self,
+        key: str,
+        seq: int,
+        metadata_line: dict[str, Any],
+        messages: list[dict[str, Any]],
+    ) -> None:
+        path = self._get_session_path(key)
+        # Metadata first, then messages; serialized outside the lock in one buffer.
+        lines = [json.dumps(metadata_line)]
+        lines.extend(json.dumps(msg) for msg in messages)
+        payload = "\n".join(lines) + "\n"
+        with self._write_lock:
+            if seq < self._written_seq.get(key, -1):
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Replace atomically so a crash mid-write never leaves a truncated session.
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, path)
+            self._written_seq[key] = seq
 
     def delete(self, key: str) -> bool:
         """
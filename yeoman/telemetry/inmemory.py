@@ -6,9 +6,12 @@ gauges, histograms, and timings for testing without external dependencies.
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass, field
 
+# Metrics are keyed by (name, labels) tuples; no label string is built per update.
+type _MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
 
 @dataclass
 class InMemoryTelemetry:
@@ -17,15 +20,15 @@ class InMemoryTelemetry:
     Stores all metrics in memory for inspection during tests.
     """
 
-    counters: dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
-    gauges: dict[str, float] = field(default_factory=dict)
-    histograms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
-    timings: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    counters: dict[_MetricKey, int] = field(default_factory=dict)
+    gauges: dict[_MetricKey, float] = field(default_factory=dict)
+    histograms: dict[_MetricKey, list[float]] = field(default_factory=lambda: defaultdict(list))
+    timings: dict[_MetricKey, list[float]] = field(default_factory=lambda: defaultdict(list))
 
     def incr(self, name: str, value: int = 1, labels: tuple[tuple[str, str], ...] = ()) -> None:
         """Increase a named counter."""
-        key = self._make_key(name, labels)
-        self.counters[key][name] += value
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
 
     def gauge(self, name: str, value: float, labels: tuple[tuple[str, str], ...] = ()) -> None:
         """Set a gauge value."""
@@ -46,19 +49,15 @@ class InMemoryTelemetry:
         key = self._make_key(name, labels)
         self.timings[key].append(value)
 
-    def _make_key(self, name: str, labels: tuple[tuple[str, str], ...] | None) -> str:
+    def _make_key(self, name: str, labels: tuple[tuple[str, str], ...] | None) -> _MetricKey:
         """Create a unique key for a metric with labels."""
-        if not labels:
-            return name
-        label_str = ",".join(f"{k}={v}" for k, v in labels)
-        return f"{name}{{{label_str}}}"
+        return (name, labels or ())
 
     # ── Test helpers ─────────────────────────────────────────────────────
 
     def get_counter(self, name: str, labels: tuple[tuple[str, str], ...] = ()) -> int:
         """Get counter value for testing."""
-        key = self._make_key(name, labels)
-        return int(self.counters[key][name])
+        return int(self.counters.get(self._make_key(name, labels), 0))
 
     def get_gauge(self, name: str, labels: tuple[tuple[str, str], ...] = ()) -> float | None:
         """Get gauge value for testing."""
@@ -69,13 +68,11 @@ class InMemoryTelemetry:
         self, name: str, labels: tuple[tuple[str, str], ...] = ()
     ) -> list[float]:
         """Get histogram values for testing."""
-        key = self._make_key(name, labels)
-        return list(self.histograms[key])
+        return list(self.histograms.get(self._make_key(name, labels), ()))
 
     def get_timing_values(self, name: str, labels: tuple[tuple[str, str], ...] = ()) -> list[float]:
         """Get timing values for testing."""
-        key = self._make_key(name, labels)
-        return list(self.timings[key])
+        return list(self.timings.get(self._make_key(name, labels), ()))
 
     def reset(self) -> None:
         """Clear all metrics."""
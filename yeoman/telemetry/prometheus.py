@@ -16,7 +16,7 @@ from __future__ import annotations
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -49,6 +49,8 @@ class PrometheusTelemetry:
     def __init__(self, config: PrometheusConfig | None = None) -> None:
         self._config = config or PrometheusConfig()
         self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        # Resolved label children keyed by (name, labels); labels() is only called once.
+        self._children: dict[tuple[str, tuple[tuple[str, str], ...]], Any] = {}
         self._started = False
 
         if not self._config.enabled:
@@ -172,45 +174,13 @@ class PrometheusTelemetry:
         """Increase a named counter."""
         if not self._config.enabled:
             return
-
-        metric = self._metrics.get(name)
-        if metric is None:
-            # Create ad-hoc counter
-            labelnames = [k for k, _ in labels] if labels else []
-            metric = self._Counter(
-                f"yeoman_{name}",
-                f"Counter: {name}",
-                labelnames=labelnames,
-            )
-            self._metrics[name] = metric
-
-        if labels:
-            label_dict = dict(labels)
-            metric.labels(**label_dict).inc(value)
-        else:
-            metric.inc(value)
+        self._child(name, labels, self._Counter, "Counter").inc(value)
 
     def gauge(self, name: str, value: float, labels: tuple[tuple[str, str], ...] = ()) -> None:
         """Set a gauge value."""
         if not self._config.enabled:
             return
-
-        metric = self._metrics.get(name)
-        if metric is None:
-            # Create ad-hoc gauge
-            labelnames = [k for k, _ in labels] if labels else []
-            metric = self._Gauge(
-                f"yeoman_{name}",
-                f"Gauge: {name}",
-                labelnames=labelnames,
-            )
-            self._metrics[name] = metric
-
-        if labels:
-            label_dict = dict(labels)
-            metric.labels(**label_dict).set(value)
-        else:
-            metric.set(value)
+        self._child(name, labels, self._Gauge, "Gauge").set(value)
 
     def histogram(
         self, name: str, value: float, labels: tuple[tuple[str, str], ...] = ()
@@ -218,23 +188,34 @@ class PrometheusTelemetry:
         """Observe a histogram value."""
         if not self._config.enabled:
             return
+        self._child(name, labels, self._Histogram, "Histogram").observe(value)
+
+    def _child(
+        self,
+        name: str,
+        labels: tuple[tuple[str, str], ...],
+        factory: Any,
+        kind: str,
+    ) -> Any:
+        """Return the metric (or its labelled child), creating ad-hoc metrics on demand."""
+        key = (name, labels)
+        child = self._children.get(key)
+        if child is not None:
+            return child
 
         metric = self._metrics.get(name)
         if metric is None:
-            # Create ad-hoc histogram
             labelnames = [k for k, _ in labels] if labels else []
-            metric = self._Histogram(
+            metric = factory(
                 f"yeoman_{name}",
-                f"Histogram: {name}",
+                f"{kind}: {name}",
                 labelnames=labelnames,
             )
             self._metrics[name] = metric
 
-        if labels:
-            label_dict = dict(labels)
-            metric.labels(**label_dict).observe(value)
-        else:
-            metric.observe(value)
+        child = metric.labels(**dict(labels)) if labels else metric
+        self._children[key] = child
+        return child
 
     def timing(
         self, name: str, value: float, labels: tuple[tuple[str, str], ...] = ()
@@ -1,8 +1,35 @@
 """Utility functions for yeoman."""
 
+import json
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def json_dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Serialize to compact JSON, using orjson when installed.
+
+    The stdlib fallback emits the same compact, non-ASCII-escaped form.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def ensure_dir(path: Path) -> Path: